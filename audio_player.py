@@ -1,6 +1,7 @@
 # audio_player.py
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Set, Optional
 
 import numpy as np
@@ -11,6 +12,16 @@ from loop_controller import LoopController
 from playback_engine import PlaybackEngine
 
 
+@dataclass
+class PlayerSnapshot:
+    """Transport state and output level read together for one UI tick."""
+    position: float
+    duration: float
+    output_level: float
+    is_playing: bool
+    is_paused: bool
+
+
 class StemAudioPlayer:
     global_master_volume: float = 1.0
     """
@@ -63,7 +74,7 @@ class StemAudioPlayer:
 
     # ---------- loading wrappers ----------
 
-    def load_audio(self, stems_dir: str, full_mix_path: str) -> Tuple[List[str], Dict[str, List[float]]]:
+    def load_audio(self, stems_dir: str, full_mix_path: str) -> Tuple[List[str], Dict[str, np.ndarray]]:
         """
         Load full mix + stems. Returns (stem_names, stem_envelopes).
         """
@@ -76,7 +87,7 @@ class StemAudioPlayer:
         self._ensure_engine()
         return stem_names, envelopes
 
-    def load_mix_only(self, full_mix_path: str) -> Tuple[List[str], Dict[str, List[float]]]:
+    def load_mix_only(self, full_mix_path: str) -> Tuple[List[str], Dict[str, np.ndarray]]:
         """
         Load only full mix (skip separation). Returns ([], {}).
         """
@@ -89,6 +100,22 @@ class StemAudioPlayer:
         self._ensure_engine()
         return stem_names, envelopes
 
+    def reset(self):
+        """
+        Drop the loaded audio and return volume, gain, loop and DSP settings
+        to their defaults, keeping the device probe and the open output
+        stream. Cheaper than building a new player between sessions.
+        """
+        # Stop first so the audio callback returns silence before the
+        # session it reads from is replaced.
+        self.is_playing = False
+        self.is_paused = False
+        self.session = AudioSession()
+        self.master_volume = 1.0
+        self.gain_db = 0.0
+        self.output_level = 0.0
+        self._reset_transport()
+
     def _reset_transport(self):
         self.play_index = 0
         self.is_playing = False
@@ -98,10 +125,10 @@ class StemAudioPlayer:
 
     # ---------- envelopes / selection ----------
 
-    def mix_envelopes(self, active_names: Set[str]) -> List[float]:
+    def mix_envelopes(self, active_names: Set[str]) -> np.ndarray:
         return self.session.mix_envelopes(active_names)
 
-    def get_mix_envelope(self) -> List[float]:
+    def get_mix_envelope(self) -> np.ndarray:
         return self.session.get_mix_envelope()
 
     def set_active_stems(self, names: Set[str]):
@@ -201,9 +228,40 @@ class StemAudioPlayer:
     def get_output_level(self) -> float:
         return self.output_level
 
+    def apply_settings(self, settings: Dict[str, object]):
+        """
+        Apply several playback settings in one call.
+
+        Recognised keys: volume, gain_db, reverb_enabled, reverb_wet,
+        loop_enabled, reset_loop, tempo_rate, pitch_semitones. Missing keys
+        leave the current value untouched. Tempo and pitch are folded into a
+        single rebuild request so at most one background render is queued.
+        """
+        if "volume" in settings:
+            self.set_master_volume(settings["volume"])
+        if "gain_db" in settings:
+            self.set_gain_db(settings["gain_db"])
+        if "reverb_enabled" in settings:
+            self.set_reverb_enabled(bool(settings["reverb_enabled"]))
+        if "reverb_wet" in settings:
+            self.set_reverb_wet(settings["reverb_wet"])
+        if "loop_enabled" in settings:
+            self.set_loop_enabled(bool(settings["loop_enabled"]))
+        if settings.get("reset_loop"):
+            self.reset_loop_points()
+
+        if "tempo_rate" in settings or "pitch_semitones" in settings:
+            self.set_tempo_and_pitch(
+                settings.get("tempo_rate", self.session.tempo_rate),
+                settings.get("pitch_semitones", self.session.pitch_semitones),
+            )
+
     # ---------- playback engine ----------
 
     def _ensure_engine(self):
+        if self.engine is not None and self.engine.sample_rate != self.session.sample_rate:
+            # A stream kept open by reset() plays at the previous song's rate
+            self.stop_stream()
         if self.engine is None:
             if self.session.sample_rate is None:
                 return
@@ -223,10 +281,11 @@ class StemAudioPlayer:
             return np.zeros(frames, dtype="float32")
 
         # 1) If a pending tempo/pitch config is ready, swap it in
-        pos_seconds = self.get_position()  # play_index / sample_rate
-        new_index = self.session.maybe_swap_pending(pos_seconds)
-        if new_index is not None:
-            self.play_index = new_index  # keep time continuous
+        if self.session.pending_ready:
+            pos_seconds = self.get_position()  # play_index / sample_rate
+            new_index = self.session.maybe_swap_pending(pos_seconds)
+            if new_index is not None:
+                self.play_index = new_index  # keep time continuous
 
         loop_bounds = self.loop_controller.get_bounds_samples(self.session.total_samples)
         loop_active = (
@@ -391,6 +450,22 @@ class StemAudioPlayer:
     def get_duration(self) -> float:
         return self.session.get_duration()
 
+    def snapshot(self) -> PlayerSnapshot:
+        """
+        Everything a periodic UI tick reads from the player, in one call
+        instead of separate get_position/get_duration/get_output_level.
+        """
+        session = self.session
+        sample_rate = session.sample_rate
+        position = 0.0 if sample_rate is None else self.play_index / float(sample_rate)
+        return PlayerSnapshot(
+            position,
+            session.get_duration(),
+            self.output_level,
+            self.is_playing,
+            self.is_paused,
+        )
+
     # ---------- convenience for GUI ----------
 
     @property
@@ -9,6 +9,10 @@ import numpy as np
 import soundfile as sf
 import librosa
 
+# Shared empty waveform envelope (read-only, like every built envelope)
+EMPTY_ENVELOPE = np.zeros(0, dtype=np.float32)
+EMPTY_ENVELOPE.flags.writeable = False
+
 
 class SimpleReverb:
     """
@@ -124,8 +128,9 @@ class AudioSession:
         self._pending_lock = threading.Lock()
 
         # Envelopes for UI (built from ORIGINAL audio only)
-        self.stem_envelopes: Dict[str, List[float]] = {}
-        self.mix_envelope: List[float] = []
+        # (read-only float32 arrays, one peak per bin)
+        self.stem_envelopes: Dict[str, np.ndarray] = {}
+        self.mix_envelope: np.ndarray = EMPTY_ENVELOPE
 
         # Playback configuration
         self.active_stems: Set[str] = set()
@@ -135,7 +140,7 @@ class AudioSession:
     # LOADING
     # -------------------------------------------------------------------------
 
-    def load_audio(self, stems_dir: str, full_mix_path: str) -> Tuple[List[str], Dict[str, List[float]]]:
+    def load_audio(self, stems_dir: str, full_mix_path: str) -> Tuple[List[str], Dict[str, np.ndarray]]:
         """
         Load:
           - full mix from full_mix_path
@@ -203,7 +208,7 @@ class AudioSession:
 
         return list(self.original_stem_data.keys()), dict(self.stem_envelopes)
 
-    def load_mix_only(self, full_mix_path: str) -> Tuple[List[str], Dict[str, List[float]]]:
+    def load_mix_only(self, full_mix_path: str) -> Tuple[List[str], Dict[str, np.ndarray]]:
         """
         Load only the full mix (no stems).
         Used when 'skip separation' is enabled.
@@ -256,7 +261,7 @@ class AudioSession:
         self.total_samples = 0
 
         self.stem_envelopes.clear()
-        self.mix_envelope = []
+        self.mix_envelope = EMPTY_ENVELOPE
 
         self.active_stems.clear()
         self.play_all = False
@@ -278,31 +283,33 @@ class AudioSession:
     # -------------------------------------------------------------------------
 
     @staticmethod
-    def _build_envelope(data: Optional[np.ndarray], max_points: int = 1000) -> List[float]:
+    def _build_envelope(data: Optional[np.ndarray], max_points: int = 1000) -> np.ndarray:
         """
-        Build a normalized amplitude envelope from raw data, downsampled
-        to at most max_points. Used only for drawing waveforms.
+        Build a normalized amplitude envelope from raw data: the peak of each
+        of ~max_points equal bins, so short transients between sample points
+        are not lost. Used only for drawing waveforms.
         """
         if data is None or data.size == 0:
-            return []
+            return EMPTY_ENVELOPE
         step = max(1, data.size // max_points)
-        env = np.abs(data[::step])
-        if env.size == 0:
-            return []
-        max_val = float(env.max() or 1.0)
-        env = env / max_val
-        return env.tolist()
-
-    def get_mix_envelope(self) -> List[float]:
-        return list(self.mix_envelope)
-
-    def mix_envelopes(self, active_names: Set[str]) -> List[float]:
+        n_bins = data.size // step
+        bins = data[: n_bins * step].reshape(n_bins, step)
+        # max |x| per bin, without an abs() copy of the whole signal
+        env = np.maximum(bins.max(axis=1), -bins.min(axis=1)).astype(np.float32)
+        env /= float(env.max() or 1.0)
+        env.flags.writeable = False
+        return env
+
+    def get_mix_envelope(self) -> np.ndarray:
+        return self.mix_envelope
+
+    def mix_envelopes(self, active_names: Set[str]) -> np.ndarray:
         """
         Mix envelopes of the given active stems (all built from original audio).
         Used for drawing waveforms when multiple stems are selected.
         """
         if not self.stem_envelopes:
-            return []
+            return EMPTY_ENVELOPE
 
         selected = [
             self.stem_envelopes[name]
@@ -311,19 +318,18 @@ class AudioSession:
         ]
         if not selected:
             any_env = next(iter(self.stem_envelopes.values()))
-            return [0.0 for _ in any_env]
+            return np.zeros(len(any_env), dtype=np.float32)
 
         length = min(len(env) for env in selected)
         if length == 0:
-            return []
+            return EMPTY_ENVELOPE
 
-        mixed = np.zeros(length, dtype="float32")
+        mixed = np.zeros(length, dtype=np.float32)
         for env in selected:
-            mixed += np.array(env[:length], dtype="float32")
+            mixed += env[:length]
 
-        max_val = float(mixed.max() or 1.0)
-        mixed /= max_val
-        return mixed.tolist()
+        mixed /= float(mixed.max() or 1.0)
+        return mixed
 
     # -------------------------------------------------------------------------
     # CONFIGURATION & REQUESTING NEW TEMPO/PITCH
@@ -632,6 +638,12 @@ class AudioSession:
         old duration = 120s, position = 30s  -> progress = 0.25
         new duration = 240s                  -> new position = 60s
         """
+        # Cheap unlocked check first: this runs on every audio callback and
+        # there is nothing to swap almost all of the time. The flag is
+        # re-checked under the lock before anything is touched.
+        if not self.pending_ready:
+            return None
+
         with self._pending_lock:
             if not self.pending_ready:
                 return None
@@ -1,22 +1,39 @@
 # gui.py
+from __future__ import annotations
+
+import base64
+import hashlib
 import math
 import os
 import threading
-import urllib.request
+import time
+import weakref
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from difflib import SequenceMatcher
+from functools import lru_cache, partial
 from io import BytesIO
+from typing import TYPE_CHECKING
 
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 
-from PIL import Image, ImageTk
+import numpy as np
 
 from audio_player import StemAudioPlayer
-from pipeline import PipelineResult, PipelineRunner
 from saved_sessions import SavedSession, SavedSessionStore
-from youtube_search import SearchResult, fetch_search_results
+from youtube_search import SearchResult, download_bytes_cached, fetch_search_results
+
+# Pillow and the pipeline (librosa, yt-dlp) are imported on first use so the
+# window comes up without paying for them.
+if TYPE_CHECKING:
+    from PIL import Image, ImageTk
+
+    from pipeline import PipelineResult, PipelineRunner
 
 CHROMA_LABELS = ['C', 'C#', 'D', 'D#', 'E', 'F',
                  'F#', 'G', 'G#', 'A', 'A#', 'B']
@@ -31,10 +48,278 @@ FLAT_TO_SHARP = {
     "Bb": "A#",
 }
 
+# Playback speeds the speed slider snaps to, sorted for bisect.
+PREFERRED_SPEEDS = (0.5, 0.75, 1.0, 1.25, 1.5)
+# Boundaries between neighbouring preferred speeds; bisecting these gives
+# the index of the nearest one directly
+SPEED_MIDPOINTS = tuple(
+    (a + b) / 2 for a, b in zip(PREFERRED_SPEEDS, PREFERRED_SPEEDS[1:])
+)
+SPEED_SNAP_THRESHOLD = 0.04
+# Pitch slider range in semitones
+PITCH_MIN = -6.0
+PITCH_MAX = 6.0
+
+# Periodic UI cadences (ms). The transport tick backs off from
+# PLAYBACK_UI_INTERVAL_MS to PLAYBACK_UI_IDLE_MAX_MS while nothing plays.
+PLAYBACK_UI_INTERVAL_MS = 100
+PLAYBACK_UI_IDLE_MAX_MS = 500
+METER_UI_INTERVAL_MS = 50
+METER_UI_IDLE_MS = 250
+# Cadence while the window is minimized; only a state check runs.
+HIDDEN_UI_INTERVAL_MS = 400
+MASTER_UI_INTERVAL_MS = 200
+MASTER_HIDDEN_INTERVAL_MS = 500
+# Volume differences below this are not worth a slider write-back
+VOLUME_EPSILON = 1e-4
+# Slider drag handlers run at most this often (~30 Hz)
+DRAG_COALESCE_MS = 33
+# Speed/pitch releases are committed to the engine after this quiet period,
+# so a quick run of clicks on a slider trough queues a single re-render
+RELEASE_COMMIT_DELAY_MS = 100
+
+# Typing in the saved-session search box refreshes the list after this pause
+SESSION_FILTER_DEBOUNCE_MS = 150
+
+# Log lines are batched into the log widget at most this often
+LOG_FLUSH_INTERVAL_MS = 100
+# Render progress from the render thread reaches the bar at most ~20 Hz
+RENDER_PROGRESS_INTERVAL_MS = 50
+
+# Polygon coordinate lists kept for recently drawn (envelope, size) pairs
+WAVE_COORDS_CACHE_SIZE = 8
+
+# Thumbnail display box, and how many decoded thumbnails to keep per window
+THUMBNAIL_SIZE = (240, 135)
+SEARCH_THUMBNAIL_SIZE = (80, 45)
+THUMBNAIL_CACHE_SIZE = 32
+# Formats Tk's PhotoImage decodes natively (PNG, GIF87a/89a)
+TK_NATIVE_IMAGE_SIGNATURES = (b"\x89PNG\r\n\x1a\n", b"GIF87a", b"GIF89a")
+# Pool threads are joined at exit, so a stalled download must not hang forever
+THUMBNAIL_TIMEOUT_S = 15
+# Detached MasterWindow session columns kept for reuse
+SESSION_COLUMN_POOL_SIZE = 16
+
+# Tonic name -> chroma index, flats included, so parsing is one lookup
+TONIC_INDEX = {name: i for i, name in enumerate(CHROMA_LABELS)}
+TONIC_INDEX.update({flat: TONIC_INDEX[sharp] for flat, sharp in FLAT_TO_SHARP.items()})
+
+# Common spellings of the mode, already lower-cased
+MODE_NAMES = {
+    "major": "major",
+    "maj": "major",
+    "minor": "minor",
+    "min": "minor",
+}
+
+# Prebuilt key names: TRANSPOSED_KEYS[mode][tonic_index][steps % 12]
+# -> e.g. "F# minor", so transposition is two list lookups.
+TRANSPOSED_KEYS = {
+    mode: [
+        [f"{CHROMA_LABELS[(tonic + steps) % 12]} {mode}" for steps in range(12)]
+        for tonic in range(12)
+    ]
+    for mode in ("major", "minor")
+}
+
+# "MM:SS" strings for the first hour, so the common case is a list lookup.
+TIME_STRINGS = [f"{i // 60:02d}:{i % 60:02d}" for i in range(3600)]
+
+
+@lru_cache(maxsize=4096)
+def format_long_time(seconds: int) -> str:
+    m, s = divmod(seconds, 60)
+    return f"{m:02d}:{s:02d}"
+
+
+def format_time(seconds: int) -> str:
+    """Format whole seconds as MM:SS (minutes keep growing past an hour)."""
+    if 0 <= seconds < 3600:
+        return TIME_STRINGS[seconds]
+    return format_long_time(seconds)
+
+
+# Slider label strings: "NN%" by whole percent, "N.NNx" by hundredths of speed
+PERCENT_LABELS = [f"{i}%" for i in range(101)]
+SPEED_LABELS = [f"{i / 100:.2f}x" for i in range(201)]
+
+
+def format_speed(rate: float) -> str:
+    i = round(rate * 100)
+    if 0 <= i < len(SPEED_LABELS):
+        return SPEED_LABELS[i]
+    return f"{rate:.2f}x"
+
+
+def snap_speed(v: float) -> float:
+    # Nearest preferred speed: one bisect over the midpoints, ties
+    # going to the faster speed.
+    closest = PREFERRED_SPEEDS[bisect_right(SPEED_MIDPOINTS, v)]
+    if abs(closest - v) <= SPEED_SNAP_THRESHOLD:
+        return closest
+    return v
+
+
+def snap_pitch(v: float) -> float:
+    """
+    Quantize to 1.0 semitone steps between -6 and +6.
+    """
+    snapped = round(v)
+    if snapped < PITCH_MIN:
+        return PITCH_MIN
+    if snapped > PITCH_MAX:
+        return PITCH_MAX
+    return snapped
+
+
+@lru_cache(maxsize=128, typed=True)
+def format_pitch_part(semitones: float) -> str:
+    # typed: 3 and 3.0 render differently ("+3" vs "+3.0")
+    sign = "+" if semitones >= 0 else ""
+    return f"{sign}{semitones}"
+
+
+def normalize_mode(mode_raw: str) -> str:
+    mode_lower = mode_raw.lower()
+    mode = MODE_NAMES.get(mode_lower)
+    if mode is not None:
+        return mode
+    if "min" in mode_lower:
+        return "minor"
+    if "maj" in mode_lower:
+        return "major"
+    return mode_raw
+
+
+# Parsed key text, keyed on the exact string. Detected keys come from a
+# small vocabulary, so this stays tiny.
+KEY_TEXT_CACHE: dict[str, tuple[int, str] | None] = {}
+
+
+def parse_key_text(key_text: str) -> tuple[int, str] | None:
+    """Parse "F# minor" style text into (tonic_index, normalized_mode)."""
+    try:
+        return KEY_TEXT_CACHE[key_text]
+    except KeyError:
+        pass
+
+    parsed = None
+    parts = key_text.split()
+    if len(parts) >= 2:
+        tonic_index = TONIC_INDEX.get(parts[0])
+        if tonic_index is not None:
+            parsed = tonic_index, normalize_mode(" ".join(parts[1:]))
+    KEY_TEXT_CACHE[key_text] = parsed
+    return parsed
+
+
+@lru_cache(maxsize=512)
+def normalize_key_text(key_text: str | None) -> str | None:
+    """Canonical "C# minor" form of a key text, or None if unparseable."""
+    if not key_text:
+        return None
+    parsed = parse_key_text(key_text)
+    if not parsed:
+        return None
+    tonic_index, mode_raw = parsed
+    return f"{CHROMA_LABELS[tonic_index]} {normalize_mode(mode_raw)}"
+
+
+@lru_cache(maxsize=512)
+def key_sort_index(key_text: str | None) -> int:
+    """Rank for sorting by key (C maj, C min, C# maj, ...); unknown keys last."""
+    normalized_key = normalize_key_text(key_text)
+    parsed = parse_key_text(normalized_key) if normalized_key else None
+    if not parsed:
+        return len(CHROMA_LABELS) * 2
+    tonic_index, mode_raw = parsed
+    mode_offset = 0 if "maj" in normalize_mode(mode_raw) else 1
+    return tonic_index * 2 + mode_offset
+
+
+def decode_thumbnail(data: bytes, size: tuple[int, int] = THUMBNAIL_SIZE) -> Image.Image:
+    """Decode and shrink thumbnail bytes. Pure PIL, so safe off the Tk thread."""
+    from PIL import Image
+
+    image = Image.open(BytesIO(data))
+    # For JPEGs, let libjpeg decode straight at a reduced scale
+    image.draft("RGB", size)
+    image.thumbnail(size)
+    return image
+
+
+# Modifier bits in Tk's event.state. Alt shows up as Mod1 (0x0008) on X11
+# and as 0x20000 on Windows.
+CTRL_STATE_MASK = 0x0004
+ALT_STATE_MASK = 0x0008 | 0x20000
+
+
+class LevelMeter(tk.Canvas):
+    """
+    Level bar drawn as a single Canvas rectangle. An update is one coords
+    call, without the theme and layout work of a ttk.Progressbar.
+    """
+
+    FILL_COLOR = "#4a90d9"
+    DISABLED_FILL_COLOR = "#a0a0a0"
+    TROUGH_COLOR = "#e6e6e6"
+
+    def __init__(self, master, orient: str = "horizontal", length: int = 100, thickness: int = 12):
+        self.vertical = orient == "vertical"
+        width, height = (thickness, length) if self.vertical else (length, thickness)
+        super().__init__(
+            master,
+            width=width,
+            height=height,
+            background=self.TROUGH_COLOR,
+            highlightthickness=0,
+            borderwidth=0,
+        )
+        self.size = (width, height)
+        self.level = 0.0
+        self.bar_id = self.create_rectangle(
+            0, 0, 0, 0, fill=self.FILL_COLOR, disabledfill=self.DISABLED_FILL_COLOR, width=0
+        )
+        self.bind("<Configure>", self.on_resize)
+
+    def on_resize(self, event):
+        self.size = (event.width, event.height)
+        self.draw()
+
+    def set_level(self, level: float):
+        level = max(0.0, min(level, 1.0))
+        if level == self.level:
+            return
+        self.level = level
+        self.draw()
+
+    def draw(self):
+        width, height = self.size
+        if self.vertical:
+            self.coords(self.bar_id, 0, height * (1.0 - self.level), width, height)
+        else:
+            self.coords(self.bar_id, 0, 0, width * self.level, height)
+
+
 class YTDemucsApp:
     instances: list["YTDemucsApp"] = []
     master_window: "MasterWindow | None" = None
 
+    # Output meter readout. Levels at or below METER_FLOOR_LEVEL all read as
+    # the floor, so the log only has to be taken above it.
+    METER_FLOOR_DB = -60.0
+    METER_FLOOR_LEVEL = 10 ** (METER_FLOOR_DB / 20.0)
+    METER_FLOOR_TEXT = f"{METER_FLOOR_DB:.1f} dB"
+    METER_SILENCE_LEVEL = 1e-6
+
+    # Waveform click handler by (Ctrl held, Alt held).
+    WAVEFORM_CLICK_HANDLERS = {
+        (True, True): "on_waveform_reset_loop",
+        (True, False): "on_waveform_set_loop_start",
+        (False, True): "on_waveform_set_loop_end",
+        (False, False): "on_waveform_seek",
+    }
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.base_title = "YouTube \u2192 Demucs Stems"
@@ -119,13 +404,7 @@ class YTDemucsApp:
         self.audio_meter_label = ttk.Label(meter_frame, text="-∞ dB", style="DisabledPlayback.TLabel")
         self.audio_meter_label.grid(row=0, column=0, pady=(8, 0))
 
-        self.audio_meter = ttk.Progressbar(
-            meter_frame,
-            mode="determinate",
-            maximum=1.0,
-            value=0.0,
-            length=260,
-        )
+        self.audio_meter = LevelMeter(meter_frame, length=260)
         self.audio_meter.grid(row=0, column=1, sticky="ew", columnspan=2, pady=(8, 0))
 
         self.gain_var = tk.DoubleVar(value=0.0)
@@ -137,11 +416,11 @@ class YTDemucsApp:
             to=10.0,
             orient="horizontal",
             variable=self.gain_var,
-            command=self.on_gain_change,
             length=280,
         )
         self.gain_slider.grid(row=1, column=1,  sticky="ew", columnspan=2, pady=(8, 0))
         self.gain_slider.bind("<ButtonRelease-1>", self.on_gain_release)
+        self.gain_var.trace_add("write", lambda *_: self.on_gain_change())
 
         self.reverb_enabled_var = tk.BooleanVar(value=False)
         self.reverb_mix_var = tk.DoubleVar(value=0.45)
@@ -162,7 +441,7 @@ class YTDemucsApp:
             to=1.0,
             orient="horizontal",
             variable=self.reverb_mix_var,
-            command=self.on_reverb_mix_change,
+            command=lambda _v: self.on_reverb_mix_change(),
             length=280,
         )
         self.reverb_mix_slider.grid(row=2, column=1, sticky="ew", pady=(10, 0))
@@ -171,8 +450,7 @@ class YTDemucsApp:
         self.harmonics_tab.rowconfigure(0, weight=1)
         harmonics_frame = ttk.Frame(self.harmonics_tab)
         harmonics_frame.grid(row=0, column=0, sticky="nsew")
-        for col in range(6):
-            harmonics_frame.columnconfigure(col, weight=1)
+        harmonics_frame.columnconfigure(tuple(range(6)), weight=1)
 
         self.key_table_headers: list[ttk.Label] = []
         self.key_table_value_labels: dict[str, ttk.Label] = {}
@@ -250,6 +528,7 @@ class YTDemucsApp:
             ("Z -> A", "z_to_a"),
             ("By key", "by_key"),
         ]
+        self.sort_value_by_label = dict(self.sort_options)
         self.sort_dropdown_var = tk.StringVar(value=self.sort_options[1][0])
         self.sort_dropdown = ttk.Combobox(
             controls_frame,
@@ -270,7 +549,7 @@ class YTDemucsApp:
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(controls_frame, textvariable=self.search_var)
         search_entry.grid(row=5, column=0, sticky="ew")
-        self.search_var.trace_add("write", lambda *_: self.refresh_saved_sessions_list())
+        self.search_var.trace_add("write", lambda *_: self.schedule_saved_sessions_refresh())
 
         self.mixable_var = tk.BooleanVar(value=False)
         mixable_cb = ttk.Checkbutton(
@@ -342,38 +621,100 @@ class YTDemucsApp:
         main_frame.rowconfigure(0, weight=1)
         main_frame.columnconfigure(0, weight=1)
         self.youtube_tab.rowconfigure(4, weight=1)
-        for c in range(3):
-            self.youtube_tab.columnconfigure(c, weight=1)
+        # grid accepts a list of indices: one Tcl call for all three columns
+        self.youtube_tab.columnconfigure((0, 1, 2), weight=1)
         self.playback_tab.columnconfigure(0, weight=1)
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
         # ---------- GUI state ----------
+        # log lines waiting for flush_log; appended from worker threads
+        self.log_buffer: deque[str] = deque()
+        self.log_lock = threading.Lock()
+        self.log_flush_scheduled = False
         self.saved_session_store = SavedSessionStore()
         self.selected_saved_session_id: str | None = None
         self.displayed_sessions: list = []
+        # (session_id, display_name) rows currently in the listbox
+        self.listed_session_rows: list[tuple[str, str]] = []
+        # pending debounced refresh from typing in the session search box
+        self.session_filter_after_id: str | None = None
+        # ((store version, sort mode), sorted sessions): filtering reuses the
+        # sorted list until the store changes or another sort is picked
+        self.sorted_sessions_cache: tuple[tuple[int, str], list[SavedSession]] | None = None
         self.current_pipeline_result: PipelineResult | None = None
         self.thumbnail_image = None
         self.current_thumbnail_bytes: bytes | None = None
+        # "url:..." / "file:path:mtime" -> (raw bytes, resized PhotoImage)
+        self.thumbnail_cache: OrderedDict[
+            str, tuple[bytes | None, tk.PhotoImage | ImageTk.PhotoImage]
+        ] = OrderedDict()
+        # Every cached PhotoImage, held weakly: entries outlive the LRU only
+        # while something else (the thumbnail label) still holds them
+        self.thumbnail_photos: weakref.WeakValueDictionary[
+            str, tk.PhotoImage | ImageTk.PhotoImage
+        ] = weakref.WeakValueDictionary()
+        # bumped when the session changes; in-flight thumbnails from an
+        # older generation are cached but not displayed
+        self.thumbnail_generation = 0
+        # content digest -> PhotoImage, held weakly: the same picture under
+        # several URLs or session files shares one Tk image
+        self.thumbnail_photos_by_digest: weakref.WeakValueDictionary[
+            bytes, tk.PhotoImage | ImageTk.PhotoImage
+        ] = weakref.WeakValueDictionary()
+        # saved-session thumbnail paths queued on io_executor
+        self.thumbnail_prefetching: set[str] = set()
+        # (path, generation) of a thumbnail to show once its prefetch lands
+        self.thumbnail_awaiting_prefetch: tuple[str, int] | None = None
 
         self.wave_canvas: tk.Canvas | None = None
         self.wave_cursor_id: int | None = None
+        # (x, height) the cursor line was last drawn at
+        self.last_cursor_geom: tuple[float, int] = (-1.0, 0)
+        self.wave_poly_id: int | None = None
+        self.last_wave_sig: tuple[np.ndarray, int, int] | None = None
+        self.wave_width = 0
+        self.wave_height = 0
         self.time_label: ttk.Label | None = None
+        # Player labels show these vars; .set() skips config's option parsing
+        self.time_text_var: tk.StringVar | None = None
+        self.volume_text_var: tk.StringVar | None = None
+        self.speed_text_var: tk.StringVar | None = None
+        self.pitch_text_var: tk.StringVar | None = None
         self.play_pause_button: ttk.Button | None = None
         self.stop_button: ttk.Button | None = None
         self.loop_button: ttk.Button | None = None
         self.volume_label: ttk.Label | None = None
+        self.last_volume_pct: int | None = None
         self.volume_var: tk.DoubleVar | None = None
         self.speed_var: tk.DoubleVar | None = None
         self.speed_label: ttk.Label | None = None
         self.pitch_var: tk.DoubleVar | None = None
         self.pitch_label: ttk.Label | None = None
+        # last values the drag handlers acted on; repeats are skipped
+        self.last_speed_drag_value: float | None = None
+        # tempo/pitch last requested from the player; None when no session
+        # is loaded
+        self.committed_speed: float | None = None
+        self.committed_pitch: float | None = None
+        self.last_pitch_drag_value: float | None = None
         self.all_var: tk.BooleanVar | None = None
         self.render_progress_var: tk.DoubleVar | None = None
         self.render_progress_label_var: tk.StringVar | None = None
         self.render_progress_bar: ttk.Progressbar | None = None
         self.render_progress_label: ttk.Label | None = None
+        self.last_render_progress: tuple[int, str] | None = None
+        # latest (progress, label) from the render thread, not yet shown
+        self.render_progress_latest: tuple[float, str] | None = None
+        self.render_progress_lock = threading.Lock()
+        self.render_progress_scheduled = False
         self.loop_start_line_id: int | None = None
         self.loop_end_line_id: int | None = None
+        self.redraw_pending = False
+        # slider name -> pending coalesce_drag after() id
+        self.drag_after_ids: dict[str, str] = {}
+        # slider name -> after id of its pending release commit
+        self.release_commit_after_ids: dict[str, str] = {}
+        self.wave_configure_after_id: str | None = None
         self.playback_control_widgets: list[tk.Widget] = [
             self.audio_meter,
             self.gain_slider,
@@ -388,20 +729,43 @@ class YTDemucsApp:
         ]
         self.playback_label_widgets.extend(self.key_table_headers)
         self.playback_label_widgets.extend(self.key_table_value_labels.values())
-        self.playback_enabled = False
-
-        self.waveform_points: list[float] = []
+        # None until set_playback_controls_state first styles the widgets
+        self.playback_enabled: bool | None = None
+
+        self.waveform_points: np.ndarray = np.zeros(0, dtype=np.float32)
+        # unit outline of waveform_points, see set_waveform_points
+        self.waveform_outline: np.ndarray = np.zeros((0, 2), dtype=np.float64)
+        # stem selection (None = full mix) -> (waveform_points, waveform_outline)
+        # for the loaded session; envelopes come from the original audio
+        self.envelope_cache: dict[frozenset[str] | None, tuple[np.ndarray, np.ndarray]] = {}
+        # (width, outline) of the envelope reduced to one peak per pixel
+        self.narrow_outline: tuple[int, np.ndarray] | None = None
+        # (id(points), w, h) -> (points, polygon coords); the array is kept
+        # so a hit can be confirmed by identity, like last_wave_sig
+        self.wave_coords_cache: OrderedDict[
+            tuple[int, int, int], tuple[np.ndarray, list[float]]
+        ] = OrderedDict()
         self.waveform_duration: float = 0.0
+        self.inv_waveform_duration: float = 0.0
         self.stem_vars: dict[str, tk.BooleanVar] = {}
+        # Checked stems, kept in step by on_stem_toggle so a selection
+        # change doesn't have to read every checkbox variable back from Tk
+        self.active_stem_names: set[str] = set()
+        # (play_all, active stems) last pushed by update_waveform_from_selection
+        self.last_selection_sig: tuple[bool, frozenset[str]] | None = None
 
         self.full_mix_path: str | None = None  # path to original yt-dlp wav
         self.current_title: str | None = None
         self.song_key_text: str | None = None  # detected key, e.g. "F major"
+        # (song_key_text, pitch part) -> pitch label text
+        self.pitch_label_cache: dict[tuple[str | None, str], str] = {}
 
         # search suggestions
         self.search_debounce_id: str | None = None
         self.search_request_counter = 0
         self.search_executor = ThreadPoolExecutor(max_workers=2)
+        # thumbnail downloads and saved-session load/save
+        self.io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gui-io")
         self.search_dropdown: tk.Toplevel | None = None
         self.search_result_frames: list[tk.Widget] = []
         self.search_result_images: list[ImageTk.PhotoImage] = []
@@ -417,14 +781,23 @@ class YTDemucsApp:
         else:
             self.player.set_render_progress_callback(self.on_render_progress)
 
-        # pipeline orchestration
-        self.pipeline_runner = PipelineRunner(
-            log_callback=self.append_log,
-            status_callback=self.set_status,
-        )
+        # pipeline orchestration, created by the first run
+        self._pipeline_runner: PipelineRunner | None = None
 
         # periodic UI updates
-        self.root.after(100, self.update_playback_ui)
+        self.playback_ui_idle_delay_ms = PLAYBACK_UI_INTERVAL_MS
+        # monotonic time the next playing tick is due; None when not on the
+        # fast cadence (stopped, paused or iconified)
+        self.playback_ui_deadline: float | None = None
+        # (elapsed, total) whole seconds currently shown in time_label
+        self.last_time_key: tuple[int, int] | None = None
+        self.last_cursor_decisec: int | None = None
+        self.last_meter_value: float | None = None
+        self.last_meter_text: str | None = None
+        self.playback_ui_after_id: str | None = self.root.after(
+            PLAYBACK_UI_INTERVAL_MS, self.update_playback_ui
+        )
+        self.root.after(METER_UI_INTERVAL_MS, self.update_meter_ui)
 
         self.set_playback_controls_state(False)
         YTDemucsApp.instances.append(self)
@@ -517,6 +890,7 @@ class YTDemucsApp:
                 pass
 
     def destroy_window(self):
+        self.cancel_release_commits()
         try:
             self.player.stop()
             self.player.stop_stream()
@@ -525,6 +899,7 @@ class YTDemucsApp:
 
         try:
             self.search_executor.shutdown(wait=False)
+            self.io_executor.shutdown(wait=False, cancel_futures=True)
         except Exception:
             pass
 
@@ -574,12 +949,28 @@ class YTDemucsApp:
     # ---------- logging / status ----------
 
     def append_log(self, message: str):
-        def _append():
-            self.log_text.configure(state="normal")
-            self.log_text.insert("end", message + "\n")
-            self.log_text.see("end")
-            self.log_text.configure(state="disabled")
-        self.root.after(0, _append)
+        """
+        Queue a log line; safe from any thread. Lines are written to the
+        log widget in one batch at most every LOG_FLUSH_INTERVAL_MS.
+        """
+        with self.log_lock:
+            self.log_buffer.append(message)
+            if self.log_flush_scheduled:
+                return
+            self.log_flush_scheduled = True
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self.flush_log)
+
+    def flush_log(self):
+        with self.log_lock:
+            messages = list(self.log_buffer)
+            self.log_buffer.clear()
+            self.log_flush_scheduled = False
+        if not messages:
+            return
+        self.log_text.configure(state="normal")
+        self.log_text.insert("end", "\n".join(messages) + "\n")
+        self.log_text.see("end")
+        self.log_text.configure(state="disabled")
 
     def set_status(self, message: str):
         self.root.after(0, lambda: self.status_var.set(message))
@@ -591,6 +982,12 @@ class YTDemucsApp:
         self.root.after(0, _set)
 
     def set_playback_controls_state(self, enabled: bool):
+        if enabled == self.playback_enabled:
+            # The control and label lists only hold the persistent widgets,
+            # which already carry this state; only the reverb row depends on
+            # anything else.
+            self.update_reverb_controls_state()
+            return
         self.playback_enabled = enabled
         state = "normal" if enabled else "disabled"
         label_style = "TLabel" if enabled else "DisabledPlayback.TLabel"
@@ -740,8 +1137,9 @@ class YTDemucsApp:
             thumb_label.pack(side="left", padx=(0, 6))
             if result.thumbnail_bytes:
                 try:
-                    image = Image.open(BytesIO(result.thumbnail_bytes))
-                    image.thumbnail((80, 45))
+                    from PIL import ImageTk
+
+                    image = decode_thumbnail(result.thumbnail_bytes, SEARCH_THUMBNAIL_SIZE)
                     photo = ImageTk.PhotoImage(image)
                     thumb_label.configure(image=photo)
                     self.search_result_images.append(photo)
@@ -858,50 +1256,163 @@ class YTDemucsApp:
             self.append_log("No thumbnail URL found.")
             return
 
-        self.append_log(f"Fetching thumbnail: {thumb_url}")
+        cache_key = f"url:{thumb_url}"
 
-        def worker():
+        def worker(generation: int):
             try:
-                req = urllib.request.Request(
-                    thumb_url,
-                    headers={"User-Agent": "Mozilla/5.0"}
-                )
-                with urllib.request.urlopen(req) as resp:
-                    data = resp.read()
-                self.current_thumbnail_bytes = data
-                self.set_thumbnail_from_bytes(data)
+                data = download_bytes_cached(thumb_url, timeout=THUMBNAIL_TIMEOUT_S)
+                self.set_thumbnail_from_bytes(data, cache_key, generation)
             except Exception as e:
                 self.append_log(f"Could not load thumbnail: {e}")
                 return
 
-        threading.Thread(target=worker, daemon=True).start()
+        def _start():
+            if self.show_cached_thumbnail(cache_key):
+                return
+            self.append_log(f"Loading thumbnail: {thumb_url}")
+            self.io_executor.submit(worker, self.thumbnail_generation)
+
+        # The cache is only touched on the Tk thread
+        self.root.after(0, _start)
+
+    def show_thumbnail(self, data: bytes | None, photo: tk.PhotoImage | ImageTk.PhotoImage):
+        self.current_thumbnail_bytes = data
+        self.thumbnail_image = photo
+        self.thumbnail_label.configure(image=photo, text="")
+
+    def show_cached_thumbnail(self, cache_key: str) -> bool:
+        entry = self.thumbnail_cache.get(cache_key)
+        if entry is None:
+            # Evicted from the LRU but possibly still alive elsewhere (e.g.
+            # on screen). Saved-session entries carry no bytes, so they can
+            # be revived from the photo alone.
+            photo = self.thumbnail_photos.get(cache_key)
+            if photo is None or not cache_key.startswith("file:"):
+                return False
+            self.remember_thumbnail(cache_key, None, photo)
+            entry = (None, photo)
+        else:
+            self.thumbnail_cache.move_to_end(cache_key)
+        self.show_thumbnail(*entry)
+        return True
+
+    def remember_thumbnail(
+        self, cache_key: str, data: bytes | None, photo: tk.PhotoImage | ImageTk.PhotoImage
+    ):
+        if cache_key.startswith("file:"):
+            # Raw bytes are only needed to save a fresh download; a saved
+            # session already has its thumbnail on disk.
+            data = None
+        self.thumbnail_cache[cache_key] = (data, photo)
+        self.thumbnail_cache.move_to_end(cache_key)
+        self.thumbnail_photos[cache_key] = photo
+        while len(self.thumbnail_cache) > THUMBNAIL_CACHE_SIZE:
+            self.thumbnail_cache.popitem(last=False)
+
+    def set_thumbnail_from_bytes(
+        self, data: bytes, cache_key: str | None = None, generation: int | None = None
+    ):
+        """
+        Decode in the calling thread (a worker, normally) and install the
+        result on the Tk thread. ``generation`` ties the request to the
+        session that asked for it; a stale result is cached but not shown.
+        """
+        image = None
+        if not data.startswith(TK_NATIVE_IMAGE_SIGNATURES):
+            try:
+                image = decode_thumbnail(data)
+            except Exception as e:
+                self.append_log(f"Could not process thumbnail: {e}")
+                return
+        self.root.after(0, lambda: self.install_thumbnail(data, image, cache_key, generation))
 
-    def set_thumbnail_from_bytes(self, data: bytes):
+    def install_thumbnail(
+        self,
+        data: bytes,
+        image: Image.Image | None,
+        cache_key: str | None,
+        generation: int | None,
+    ):
+        """Tk thread: wrap the decoded image (or PNG/GIF bytes) in a PhotoImage."""
         try:
-            image = Image.open(BytesIO(data))
-            image.thumbnail((240, 135))
-            photo = ImageTk.PhotoImage(image)
+            photo = self.thumbnail_photo(data, image)
         except Exception as e:
             self.append_log(f"Could not process thumbnail: {e}")
             return
+        if cache_key is not None:
+            self.remember_thumbnail(cache_key, data, photo)
+            # keeps the bytes only where remember_thumbnail did
+            data = self.thumbnail_cache[cache_key][0]
+        if generation is None or generation == self.thumbnail_generation:
+            self.show_thumbnail(data, photo)
+
+    def thumbnail_photo(
+        self, data: bytes, image: Image.Image | None
+    ) -> tk.PhotoImage | ImageTk.PhotoImage:
+        """
+        PhotoImage for thumbnail ``data`` (decoded to ``image`` unless Tk reads
+        it natively), reusing a live one with the same content. Tk thread only.
+        """
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        photo = self.thumbnail_photos_by_digest.get(digest)
+        if photo is not None:
+            return photo
+        if image is None:
+            photo = self.native_thumbnail_photo(data)
+        else:
+            from PIL import ImageTk
 
-        def _set():
-            self.thumbnail_image = photo
-            self.thumbnail_label.configure(image=photo, text="")
-        self.root.after(0, _set)
+            photo = ImageTk.PhotoImage(image)
+        self.thumbnail_photos_by_digest[digest] = photo
+        return photo
+
+    def native_thumbnail_photo(self, data: bytes) -> tk.PhotoImage:
+        """
+        PNG/GIF thumbnails are decoded by Tk itself and shrunk with an
+        integer subsample, skipping Pillow. Tk thread only.
+        """
+        photo = tk.PhotoImage(master=self.root, data=base64.b64encode(data))
+        box_w, box_h = THUMBNAIL_SIZE
+        factor = max(
+            math.ceil(photo.width() / box_w),
+            math.ceil(photo.height() / box_h),
+        )
+        if factor > 1:
+            photo = photo.subsample(factor)
+        return photo
+
+    @staticmethod
+    def thumbnail_file_key(path: str) -> str | None:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        return f"file:{path}:{mtime}"
 
     def set_thumbnail_from_file(self, path: str):
-        if not path or not os.path.exists(path):
+        cache_key = self.thumbnail_file_key(path) if path else None
+        if cache_key is None:
             self.append_log("Thumbnail not found on disk.")
             return
-        try:
-            with open(path, "rb") as f:
-                data = f.read()
-            self.current_thumbnail_bytes = data
-        except Exception as e:
-            self.append_log(f"Failed to read thumbnail: {e}")
+        if self.show_cached_thumbnail(cache_key):
             return
-        self.set_thumbnail_from_bytes(self.current_thumbnail_bytes)
+        generation = self.thumbnail_generation
+        if path in self.thumbnail_prefetching:
+            # Already being read and decoded; show it when that finishes
+            # rather than reading the file a second time.
+            self.thumbnail_awaiting_prefetch = (path, generation)
+            return
+
+        def worker():
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except Exception as e:
+                self.append_log(f"Failed to read thumbnail: {e}")
+                return
+            self.set_thumbnail_from_bytes(data, cache_key, generation)
+
+        self.io_executor.submit(worker)
 
     # ---------- main button ----------
 
@@ -915,6 +1426,19 @@ class YTDemucsApp:
 
     # ---------- pipeline ----------
 
+    @property
+    def pipeline_runner(self) -> PipelineRunner:
+        # Pipeline runs start on a worker thread, so the heavy import lands
+        # there rather than on the Tk thread.
+        if self._pipeline_runner is None:
+            from pipeline import PipelineRunner
+
+            self._pipeline_runner = PipelineRunner(
+                log_callback=self.append_log,
+                status_callback=self.set_status,
+            )
+        return self._pipeline_runner
+
     def run_pipeline(self, url: str):
         self.set_running(True)
         try:
@@ -929,31 +1453,77 @@ class YTDemucsApp:
             self.set_running(False)
 
     def handle_pipeline_success(self, result: PipelineResult):
+        # Called on the pipeline thread; like loading a saved session, the old
+        # player is torn down on the Tk thread before the new audio is read.
+        self.root.after(0, lambda: self.start_pipeline_session(result))
+
+    def start_pipeline_session(self, result: PipelineResult):
+        self.show_session_loading(f"Loading {result.title}...")
+        self.clear_current_session()
+        self.saved_sessions_listbox.selection_clear(0, tk.END)
+
         self.full_mix_path = result.audio_path
         self.current_title = result.title
         self.song_key_text = result.song_key_text
         self.current_pipeline_result = result
         self.selected_saved_session_id = None
-        self.saved_sessions_listbox.selection_clear(0, tk.END)
 
         if result.thumbnail_url:
             self.update_thumbnail(result.thumbnail_url)
 
         window_title = result.title if not result.separated else f"{result.title} [sep]"
-        self.root.after(0, lambda t=window_title: self.root.title(t))
-        self.root.after(0, lambda: self.setup_player(result.stems_dir))
-        self.root.after(0, lambda: self.notebook.select(self.playback_tab))
-        self.root.after(0, self.update_key_table)
-        self.update_save_button_state()
+        self.root.title(window_title)
+
+        def worker():
+            preloaded = None
+            if self.player.audio_ok:
+                try:
+                    if result.stems_dir is None:
+                        preloaded = self.player.load_mix_only(result.audio_path)
+                    else:
+                        preloaded = self.player.load_audio(result.stems_dir, result.audio_path)
+                except Exception as e:
+                    self.append_log(f"Failed to load audio: {e}")
+                    self.root.after(0, _fail)
+                    return
+
+            def _finish():
+                self.setup_player(result.stems_dir, preloaded=preloaded)
+                self.notebook.select(self.playback_tab)
+                self.update_key_table()
+                self.hide_session_loading()
+
+            self.root.after(0, _finish)
+
+        def _fail():
+            # The previous player was already cleared above; make sure nothing
+            # half-built is left behind and give the sessions list back.
+            self.reset_player_frame()
+            self.update_player_frame_visibility()
+            self.update_key_table()
+            self.hide_session_loading()
+
+        self.io_executor.submit(worker)
 
     # ---------- saved sessions ----------
 
+    def schedule_saved_sessions_refresh(self):
+        """Refresh the list once typing pauses for SESSION_FILTER_DEBOUNCE_MS."""
+        if self.session_filter_after_id is not None:
+            self.root.after_cancel(self.session_filter_after_id)
+        self.session_filter_after_id = self.root.after(
+            SESSION_FILTER_DEBOUNCE_MS, self.refresh_saved_sessions_list
+        )
+
     def refresh_saved_sessions_list(self):
-        self.saved_sessions_listbox.delete(0, tk.END)
+        if self.session_filter_after_id is not None:
+            # a direct refresh supersedes the pending debounced one
+            self.root.after_cancel(self.session_filter_after_id)
+            self.session_filter_after_id = None
         self.displayed_sessions = self.get_filtered_sorted_sessions()
-
-        for session in self.displayed_sessions:
-            self.saved_sessions_listbox.insert(tk.END, session.display_name)
+        self.sync_saved_sessions_listbox(
+            [(session.session_id, session.display_name) for session in self.displayed_sessions]
+        )
 
         if self.selected_saved_session_id:
             for idx, session in enumerate(self.displayed_sessions):
@@ -967,13 +1537,79 @@ class YTDemucsApp:
             self.saved_sessions_listbox.selection_clear(0, tk.END)
 
         self.update_save_button_state()
+        self.prefetch_saved_thumbnails()
+
+    def sync_saved_sessions_listbox(self, rows: list[tuple[str, str]]):
+        """
+        Bring the listbox to ``rows`` with the fewest deletes/inserts, so
+        re-filtering or adding one session doesn't rebuild the whole list.
+        """
+        listbox = self.saved_sessions_listbox
+        old_rows = self.listed_session_rows
+        matcher = SequenceMatcher(None, old_rows, rows, autojunk=False)
+        # Back to front, so earlier indices stay valid while editing
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                continue
+            if i2 > i1:
+                listbox.delete(i1, i2 - 1)
+            if j2 > j1:
+                listbox.insert(i1, *(name for _sid, name in rows[j1:j2]))
+        self.listed_session_rows = rows
+
+    def prefetch_saved_thumbnails(self):
+        """
+        Read and decode the listed sessions' thumbnails on the I/O pool so
+        that clicking a saved session finds its thumbnail already cached.
+        The cache is only consulted here, on the Tk thread.
+        """
+        pending = []
+        for session in self.displayed_sessions[:THUMBNAIL_CACHE_SIZE]:
+            path = session.thumbnail_path
+            if not path or path in self.thumbnail_prefetching:
+                continue
+            cache_key = self.thumbnail_file_key(path)
+            if cache_key is None or cache_key in self.thumbnail_cache:
+                continue
+            pending.append((path, cache_key))
+        for path, cache_key in pending:
+            self.thumbnail_prefetching.add(path)
+            self.io_executor.submit(self.prefetch_thumbnail, path, cache_key)
+
+    def prefetch_thumbnail(self, path: str, cache_key: str):
+        data = None
+        image = None
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if not data.startswith(TK_NATIVE_IMAGE_SIGNATURES):
+                image = decode_thumbnail(data)
+        except Exception:
+            data = None
+
+        def _store():
+            self.thumbnail_prefetching.discard(path)
+            if data is not None and cache_key not in self.thumbnail_cache:
+                try:
+                    photo = self.thumbnail_photo(data, image)
+                    self.remember_thumbnail(cache_key, data, photo)
+                except Exception:
+                    pass
+
+            awaiting = self.thumbnail_awaiting_prefetch
+            if awaiting is not None and awaiting[0] == path:
+                self.thumbnail_awaiting_prefetch = None
+                if awaiting[1] == self.thumbnail_generation:
+                    # shows the cached result, or reads the file itself if
+                    # the prefetch failed
+                    self.set_thumbnail_from_file(path)
+        self.root.after(0, _store)
 
     def on_sort_selection(self):
-        selected_label = self.sort_dropdown_var.get()
-        for label, value in self.sort_options:
-            if label == selected_label:
-                self.sort_var.set(value)
-                break
+        value = self.sort_value_by_label.get(self.sort_dropdown_var.get())
+        if value is None or value == self.sort_var.get():
+            return  # re-picking the current order changes nothing
+        self.sort_var.set(value)
         self.refresh_saved_sessions_list()
 
     def reset_session_filters(self):
@@ -994,29 +1630,12 @@ class YTDemucsApp:
         except Exception:
             return datetime.min
 
-    def normalize_key_text(self, key_text: str | None) -> str | None:
-        if not key_text:
-            return None
-        parsed = self.parse_key_text(key_text)
-        if not parsed:
-            return None
-        tonic_index, mode_raw = parsed
-        normalized_mode = self.normalize_mode(mode_raw)
-        return f"{CHROMA_LABELS[tonic_index]} {normalized_mode}"
-
-    def key_sort_value(self, session: SavedSession):
-        normalized_key = self.normalize_key_text(session.song_key_text)
-        if not normalized_key:
-            return (len(CHROMA_LABELS) * 2, session.title.lower())
-
-        parsed = self.parse_key_text(normalized_key)
-        if not parsed:
-            return (len(CHROMA_LABELS) * 2, session.title.lower())
+    normalize_key_text = staticmethod(normalize_key_text)
 
-        tonic_index, mode_raw = parsed
-        mode_norm = self.normalize_mode(mode_raw)
-        mode_offset = 0 if "maj" in mode_norm else 1
-        return (tonic_index * 2 + mode_offset, session.title.lower())
+    @staticmethod
+    def key_sort_value(session: SavedSession):
+        # the key rank is memoised per key text; only the title is per call
+        return (key_sort_index(session.song_key_text), session.title.lower())
 
     def compute_mixable_keys(self, tonic_index: int, mode_raw: str) -> set[str]:
         normalized_mode = self.normalize_mode(mode_raw)
@@ -1066,18 +1685,31 @@ class YTDemucsApp:
             return sorted(sessions, key=self.key_sort_value)
         return sessions
 
+    def get_sorted_sessions(self) -> list[SavedSession]:
+        store = self.saved_session_store
+        cache_key = (store.version, self.sort_var.get())
+        cached = self.sorted_sessions_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        sessions = self.sort_sessions(store.list_sessions())
+        self.sorted_sessions_cache = (cache_key, sessions)
+        return sessions
+
     def get_filtered_sorted_sessions(self) -> list[SavedSession]:
-        sessions = self.sort_sessions(self.saved_session_store.list_sessions())
+        sessions = self.get_sorted_sessions()
         search_text = self.search_var.get().strip().lower()
         mixable_enabled = self.mixable_var.get()
         mixable_keys = self.get_mixable_keys_from_selection() if mixable_enabled else set()
 
+        show_sep = self.show_sep_var.get()
+        show_ns = self.show_ns_var.get()
+
         filtered: list[SavedSession] = []
         for session in sessions:
             has_stems = session.stems_dir is not None
-            if not self.show_sep_var.get() and has_stems:
+            if not show_sep and has_stems:
                 continue
-            if not self.show_ns_var.get() and not has_stems:
+            if not show_ns and not has_stems:
                 continue
 
             if search_text:
@@ -1188,7 +1820,7 @@ class YTDemucsApp:
                 self.update_save_button_state()
             self.root.after(0, _after_save)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self.io_executor.submit(worker)
 
     def delete_selected_session(self):
         session = self.saved_session_store.get_session(self.selected_saved_session_id)
@@ -1238,14 +1870,14 @@ class YTDemucsApp:
 
             self.root.after(0, _finish)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self.io_executor.submit(worker)
 
     # ---------- player UI ----------
 
     def setup_player(
         self,
         stems_dir: str | None,
-        preloaded: tuple[list[str], dict[str, list[float]]] | None = None,
+        preloaded: tuple[list[str], dict[str, np.ndarray]] | None = None,
     ):
         if not self.player.audio_ok:
             self.append_log("Audio playback not available (sounddevice init failed).")
@@ -1255,26 +1887,41 @@ class YTDemucsApp:
             return
 
         # clear UI
-        for w in self.player_frame.winfo_children():
-            w.destroy()
+        self.reset_player_frame()
 
         self.wave_canvas = None
         self.wave_cursor_id = None
+        self.wave_poly_id = None
+        self.last_wave_sig = None
+        self.wave_width = 0
+        self.wave_height = 0
         self.time_label = None
+        self.time_text_var = None
+        self.volume_text_var = None
+        self.speed_text_var = None
+        self.pitch_text_var = None
+        self.last_time_key = None
+        self.last_cursor_decisec = None
         self.play_pause_button = None
         self.stop_button = None
         self.loop_button = None
         self.volume_var = None
         self.volume_label = None
+        self.last_volume_pct = None
         self.speed_var = None
+        self.committed_speed = None
         self.speed_label = None
         self.pitch_var = None
+        self.committed_pitch = None
         self.pitch_label = None
+        self.last_speed_drag_value = None
+        self.last_pitch_drag_value = None
         self.all_var = None
         self.render_progress_var = None
         self.render_progress_label_var = None
         self.render_progress_bar = None
         self.render_progress_label = None
+        self.last_render_progress = None
         self.playback_control_widgets = [
             self.audio_meter,
             self.gain_slider,
@@ -1289,11 +1936,15 @@ class YTDemucsApp:
         ]
         self.playback_label_widgets.extend(self.key_table_headers)
         self.playback_label_widgets.extend(self.key_table_value_labels.values())
-        self.waveform_points = []
-        self.waveform_duration = 0.0
+        self.set_waveform_points(())
+        self.envelope_cache.clear()
+        self.wave_coords_cache.clear()
+        self.set_waveform_duration(0.0)
         self.loop_start_line_id = None
         self.loop_end_line_id = None
         self.stem_vars.clear()
+        self.active_stem_names = set()
+        self.last_selection_sig = None
 
         # load audio via player
         try:
@@ -1311,7 +1962,7 @@ class YTDemucsApp:
             self.append_log(f"Failed to load audio: {e}")
             return
 
-        self.waveform_duration = self.player.get_duration()
+        self.set_waveform_duration(self.player.get_duration())
 
         self.set_playback_controls_state(True)
 
@@ -1330,7 +1981,6 @@ class YTDemucsApp:
             sticky="ew",
             pady=(0, 5),
         )
-        self.player_frame.columnconfigure(0, weight=1)
         self.wave_canvas.bind("<Configure>", self.on_waveform_configure)
         self.wave_canvas.bind("<Button-1>", self.on_waveform_click)
 
@@ -1348,11 +1998,13 @@ class YTDemucsApp:
                 stems_frame,
                 text=stem_name,
                 variable=var,
-                command=self.on_stem_toggle,
+                command=partial(self.on_stem_toggle, stem_name),
             )
             cb.grid(row=0, column=idx + 1, padx=(0, 5))
             self.stem_vars[stem_name] = var
 
+        self.active_stem_names = set(self.stem_vars)
+
         # "All" checkbox (full mix)
         self.all_var = tk.BooleanVar(value=(stems_dir is None))
         cb_all = ttk.Checkbutton(
@@ -1369,20 +2021,19 @@ class YTDemucsApp:
 
         # time label + controls
 
-        # Columns 1–5: buttons – equal size, minimum 160px each
-        # Column 0: time label — inflexible (no stretch)
-        self.player_frame.columnconfigure(0, weight=0)
-
-        # Columns 1–5: buttons — flexible, equal width, with a min size
-        for col in range(1, 6):
-            self.player_frame.columnconfigure(
-                col,
-                weight=1,
-                minsize=40,
-                uniform="buttons",
-            )
+        # Column 0: time label — inflexible (no stretch); a fresh frame
+        # already has weight 0 there.
+        # Columns 1–5: buttons — flexible, equal width, with a min size,
+        # configured in one call.
+        self.player_frame.columnconfigure(
+            (1, 2, 3, 4, 5),
+            weight=1,
+            minsize=40,
+            uniform="buttons",
+        )
 
-        self.time_label = ttk.Label(self.player_frame, text="00:00 / 00:00")
+        self.time_text_var = tk.StringVar(value="00:00 / 00:00")
+        self.time_label = ttk.Label(self.player_frame, textvariable=self.time_text_var)
         # No sticky -> it keeps its natural (requested) size
         self.time_label.grid(row=2, column=0, pady=(5, 0))
 
@@ -1414,7 +2065,9 @@ class YTDemucsApp:
         self.update_loop_button()
 
         # master volume (row 3) – wider slider via length
-        self.volume_label = ttk.Label(self.player_frame, text="100%")
+        self.volume_text_var = tk.StringVar(value=PERCENT_LABELS[100])
+        self.volume_label = ttk.Label(self.player_frame, textvariable=self.volume_text_var)
+        self.last_volume_pct = 100
         self.volume_label.grid(
             row=3, column=0, pady=(5, 0)
         )
@@ -1426,15 +2079,20 @@ class YTDemucsApp:
             to=1.0,
             orient="horizontal",
             variable=self.volume_var,
-            command=self.on_volume_change,  # live update on drag
             length=500,                     # keep it wide
         )
         vol_slider.grid(row=3, column=1, columnspan=5, sticky="ew", pady=(5, 0))
+        # live update on drag
+        self.volume_var.trace_add(
+            "write", lambda *_: self.coalesce_drag("volume", self.on_volume_change)
+        )
 
 
         # playback speed (row 4) – snapping + wider slider
         self.speed_var = tk.DoubleVar(value=1.0)
-        self.speed_label = ttk.Label(self.player_frame, text="1.00x")
+        self.committed_speed = 1.0
+        self.speed_text_var = tk.StringVar(value=format_speed(1.0))
+        self.speed_label = ttk.Label(self.player_frame, textvariable=self.speed_text_var)
         self.speed_label.grid(row=4, column=0, pady=(5, 0))
 
         speed_slider = ttk.Scale(
@@ -1443,33 +2101,40 @@ class YTDemucsApp:
             to=2.0,
             orient="horizontal",
             variable=self.speed_var,
-            command=self.on_speed_drag,   # update label while dragging
             length=500,
         )
         speed_slider.grid(row=4, column=1, columnspan=5, sticky="ew", pady=(5, 0))
         speed_slider.bind("<ButtonRelease-1>", self.on_speed_release)
+        # update label while dragging
+        self.speed_var.trace_add(
+            "write", lambda *_: self.coalesce_drag("speed", self.on_speed_drag)
+        )
 
         # pitch (row 5) – semitones, -6..+6, 1.0 steps
         self.pitch_var = tk.DoubleVar(value=0)
+        self.committed_pitch = 0.0
         initial_pitch = 0
+        self.pitch_text_var = tk.StringVar(value=self.format_pitch_label(initial_pitch))
         self.pitch_label = ttk.Label(
             self.player_frame,
             width=12,
-            text=self.format_pitch_label(initial_pitch)
+            textvariable=self.pitch_text_var,
         )
         self.pitch_label.grid(row=5, column=0, pady=(5, 0))
 
         pitch_slider = ttk.Scale(
             self.player_frame,
-            from_=-6.0,
-            to=6.0,
+            from_=PITCH_MIN,
+            to=PITCH_MAX,
             orient="horizontal",
             variable=self.pitch_var,
-            command=self.on_pitch_drag,
             length=500,
         )
         pitch_slider.grid(row=5, column=1, columnspan=5, sticky="ew", pady=(5, 0))
         pitch_slider.bind("<ButtonRelease-1>", self.on_pitch_release)
+        self.pitch_var.trace_add(
+            "write", lambda *_: self.coalesce_drag("pitch", self.on_pitch_drag)
+        )
 
         self.update_key_table(self.pitch_var.get())
 
@@ -1478,7 +2143,7 @@ class YTDemucsApp:
         if self.reverb_mix_var is not None:
             self.reverb_mix_var.set(0.45)
         self.player.set_reverb_enabled(bool(self.reverb_enabled_var.get()))
-        self.on_reverb_mix_change(str(self.reverb_mix_var.get()))
+        self.on_reverb_mix_change()
         self.update_reverb_controls_state()
 
         # rendering progress (bottom of player area)
@@ -1518,153 +2183,336 @@ class YTDemucsApp:
 
         # initial waveform
         self.update_waveform_from_selection()
-        self.draw_waveform()
+        self.request_redraw()
 
         self.update_player_frame_visibility()
 
+    def reset_player_frame(self):
+        """
+        Drop every player widget with a single destroy of the container and
+        start over from an empty frame, instead of destroying children one
+        by one (each of which triggers a geometry re-layout).
+        The new frame is gridded by update_player_frame_visibility.
+        """
+        self.cancel_release_commits()
+        parent = self.player_frame.master
+        self.player_frame.destroy()
+        self.player_frame = ttk.Frame(parent)
+
     # ---------- waveform logic ----------
 
     def on_waveform_configure(self, event):
+        if event.width == self.wave_width and event.height == self.wave_height:
+            # Tk also sends <Configure> for moves and restacking; same size
+            # means the drawn geometry is still valid.
+            return
+        self.wave_width = event.width
+        self.wave_height = event.height
+        # <Configure> fires continuously during a resize drag; only redraw
+        # once the size has settled for a frame (~60 Hz).
+        if self.wave_configure_after_id is not None:
+            self.root.after_cancel(self.wave_configure_after_id)
+        self.wave_configure_after_id = self.root.after(16, self.on_waveform_configure_settled)
+
+    def on_waveform_configure_settled(self):
+        self.wave_configure_after_id = None
+        self.request_redraw()
+
+    def get_wave_size(self) -> tuple[int, int]:
+        """
+        Canvas size as last reported by <Configure>. Only queries Tk
+        directly before the first configure event has arrived.
+        """
+        if self.wave_width <= 0 or self.wave_height <= 0:
+            if self.wave_canvas is None:
+                return 0, 0
+            return self.wave_canvas.winfo_width(), self.wave_canvas.winfo_height()
+        return self.wave_width, self.wave_height
+
+    def request_redraw(self):
+        """
+        Schedule a waveform redraw for the next idle point. Multiple requests
+        within the same event-loop tick collapse into a single draw.
+        """
+        if self.redraw_pending:
+            return
+        self.redraw_pending = True
+        self.root.after_idle(self.flush_redraw)
+
+    def flush_redraw(self):
+        self.redraw_pending = False
         self.draw_waveform()
 
+    def set_waveform_duration(self, duration: float):
+        """
+        Store the waveform duration together with its reciprocal so the
+        cursor/marker paths can multiply instead of divide.
+        """
+        self.waveform_duration = duration
+        self.inv_waveform_duration = 1.0 / duration if duration > 0 else 0.0
+
     def update_waveform_from_selection(self):
         """
         Update player mode + waveform_points based on the current checkbox state.
         - If "All" is checked -> play full mix, waveform = full mix envelope
         - Else -> mix selected stems
         """
-        if self.all_var is not None and self.all_var.get():
+        self.last_selection_sig = self.selection_signature()
+        if self.last_selection_sig[0]:
             self.player.set_play_all(True)
-            active = set()
-            self.player.set_active_stems(active)
-            self.waveform_points = self.player.get_mix_envelope()
+            self.player.set_active_stems(set())
+            cache_key = None
         else:
-            active = {
-                name for name, var in self.stem_vars.items() if var.get()
-            }
+            active = self.active_stem_names
             self.player.set_play_all(False)
             self.player.set_active_stems(active)
-            self.waveform_points = self.player.mix_envelopes(active)
+            cache_key = self.last_selection_sig[1]
 
-    def draw_waveform(self):
-        if self.wave_canvas is None:
+        cached = self.envelope_cache.get(cache_key)
+        if cached is not None:
+            self.waveform_points, self.waveform_outline = cached
+            self.narrow_outline = None
             return
 
-        self.wave_canvas.delete("wave")
-        self.wave_canvas.delete("loop_marker")
-        w = self.wave_canvas.winfo_width()
-        h = self.wave_canvas.winfo_height()
-        if w <= 2 or h <= 2 or not self.waveform_points:
-            return
+        if cache_key is None:
+            self.set_waveform_points(self.player.get_mix_envelope())
+        else:
+            self.set_waveform_points(self.player.mix_envelopes(cache_key))
+        self.envelope_cache[cache_key] = (self.waveform_points, self.waveform_outline)
+
+    def set_waveform_points(self, envelope):
+        """
+        Store the envelope and its size-independent outline: the top edge
+        left -> right then the mirrored bottom edge right -> left, with x in
+        [0, 1] and y in [-1, 1]. draw_waveform only has to scale it.
+        """
+        points = np.asarray(envelope, dtype=np.float32)
+        self.waveform_points = points
+        self.waveform_outline = self.build_wave_outline(points)
+        self.narrow_outline = None
 
-        mid_y = h / 2
-        n = len(self.waveform_points)
+    @staticmethod
+    def build_wave_outline(points: np.ndarray) -> np.ndarray:
+        n = len(points)
         if n < 2:
+            return np.zeros((0, 2), dtype=np.float64)
+        xs = np.linspace(0.0, 1.0, n)
+        amps = points.astype(np.float64)
+        top = np.column_stack((xs, -amps))
+        bottom = np.column_stack((xs[::-1], amps[::-1]))
+        return np.concatenate((top, bottom))
+
+    def get_wave_outline(self, width: int) -> np.ndarray:
+        """
+        Outline to draw at ``width`` pixels. When the envelope has more
+        points than pixel columns, it is reduced to one peak per column
+        first, so the polygon never carries vertices nobody can see.
+        """
+        points = self.waveform_points
+        if len(points) <= width:
+            return self.waveform_outline
+        cached = self.narrow_outline
+        if cached is not None and cached[0] == width:
+            return cached[1]
+        starts = np.linspace(0, len(points), width, endpoint=False).astype(np.intp)
+        outline = self.build_wave_outline(np.maximum.reduceat(points, starts))
+        self.narrow_outline = (width, outline)
+        return outline
+
+    def draw_waveform(self):
+        canvas = self.wave_canvas
+        if canvas is None:
+            return
+
+        w, h = self.get_wave_size()
+        points = self.waveform_points
+        n = len(points)
+        if w <= 2 or h <= 2 or n < 2:
+            # Nothing sensible to draw; hide the persistent items instead
+            # of deleting them so they can be reused on the next draw.
+            for item_id in (self.wave_poly_id, self.loop_start_line_id, self.loop_end_line_id):
+                if item_id is not None:
+                    canvas.itemconfigure(item_id, state="hidden")
+            self.last_wave_sig = None
             return
 
-        x_step = w / float(n - 1)
-        max_amp = h / 2 - 2
+        # Same envelope at the same size: the polygon is already correct,
+        # only the markers/cursor may have moved. The array itself is kept
+        # in the signature (compared by identity) so a recycled id() can
+        # never produce a false match.
+        last = self.last_wave_sig
+        if (
+            last is not None
+            and self.wave_poly_id is not None
+            and last[0] is points
+            and last[1] == w
+            and last[2] == h
+        ):
+            self.draw_loop_markers()
+            self.draw_cursor()
+            return
 
-        for i, amp in enumerate(self.waveform_points):
-            x = i * x_step
-            y = amp * max_amp
-            self.wave_canvas.create_line(
-                x, mid_y - y, x, mid_y + y,
+        # Toggling back to a recently shown stem selection reuses its
+        # coordinates instead of rescaling the outline.
+        coords_key = (id(points), w, h)
+        cached = self.wave_coords_cache.get(coords_key)
+        if cached is not None and cached[0] is points:
+            self.wave_coords_cache.move_to_end(coords_key)
+            coords = cached[1]
+        else:
+            mid_y = h / 2
+            max_amp = h / 2 - 2
+
+            # Scale the precomputed outline to pixels and flatten to
+            # x0, y0, x1, y1... Rounded to two decimals to keep the Tcl
+            # coordinate strings short.
+            scaled = self.get_wave_outline(w) * (float(w), max_amp)
+            scaled[:, 1] += mid_y
+            coords = scaled.ravel().round(2).tolist()
+            self.wave_coords_cache[coords_key] = (points, coords)
+            if len(self.wave_coords_cache) > WAVE_COORDS_CACHE_SIZE:
+                self.wave_coords_cache.popitem(last=False)
+
+        if self.wave_poly_id is None:
+            self.wave_poly_id = canvas.create_polygon(
+                coords,
                 fill="#808080",
+                outline="",
                 tags="wave",
             )
+            canvas.tag_lower(self.wave_poly_id)
+        else:
+            canvas.coords(self.wave_poly_id, coords)
+            canvas.itemconfigure(self.wave_poly_id, state="normal")
+        self.last_wave_sig = (points, w, h)
 
         self.draw_loop_markers()
         self.draw_cursor()
 
     def draw_loop_markers(self):
-        if self.wave_canvas is None or self.waveform_duration <= 0:
+        canvas = self.wave_canvas
+        if canvas is None or self.waveform_duration <= 0:
             return
 
-        w = self.wave_canvas.winfo_width()
-        h = self.wave_canvas.winfo_height()
+        w, h = self.get_wave_size()
         if w <= 2 or h <= 2:
             return
 
         start_sec, end_sec = self.player.get_loop_bounds_seconds()
-        start_x = (start_sec / self.waveform_duration) * w
-        end_x = (end_sec / self.waveform_duration) * w
-
-        self.loop_start_line_id = self.wave_canvas.create_line(
-            start_x,
-            0,
-            start_x,
-            h,
-            fill="#00cc66",
-            width=2,
-            tags="loop_marker",
-        )
-
-        self.loop_end_line_id = self.wave_canvas.create_line(
-            end_x,
-            0,
-            end_x,
-            h,
-            fill="#cc0000",
-            width=2,
-            tags="loop_marker",
-        )
-
-    def draw_cursor(self):
-        if self.wave_canvas is None or self.waveform_duration <= 0:
+        scale = self.inv_waveform_duration * w
+        start_x = start_sec * scale
+        end_x = end_sec * scale
+
+        start_id = self.loop_start_line_id
+        if start_id is None:
+            self.loop_start_line_id = canvas.create_line(
+                start_x,
+                0,
+                start_x,
+                h,
+                fill="#00cc66",
+                width=2,
+                tags="loop_marker",
+            )
+        else:
+            canvas.coords(start_id, start_x, 0, start_x, h)
+            canvas.itemconfigure(start_id, state="normal")
+
+        end_id = self.loop_end_line_id
+        if end_id is None:
+            self.loop_end_line_id = canvas.create_line(
+                end_x,
+                0,
+                end_x,
+                h,
+                fill="#cc0000",
+                width=2,
+                tags="loop_marker",
+            )
+        else:
+            canvas.coords(end_id, end_x, 0, end_x, h)
+            canvas.itemconfigure(end_id, state="normal")
+
+    def draw_cursor(self, pos: float | None = None):
+        """Place the cursor line; pos defaults to the player's position."""
+        canvas = self.wave_canvas
+        dur = self.waveform_duration
+        if canvas is None or dur <= 0:
             return
 
-        pos = self.player.get_position()
-        pos = max(0.0, min(pos, self.waveform_duration))
-
-        w = self.wave_canvas.winfo_width()
-        h = self.wave_canvas.winfo_height()
+        w, h = self.get_wave_size()
         if w <= 2 or h <= 2:
             return
 
-        x = (pos / self.waveform_duration) * w
-
-        if self.wave_cursor_id is not None:
-            self.wave_canvas.coords(self.wave_cursor_id, x, 0, x, h)
+        if pos is None:
+            pos = self.player.get_position()
+        if pos < 0.0:
+            pos = 0.0
+        elif pos > dur:
+            pos = dur
+        x = pos * self.inv_waveform_duration * w
+
+        cursor_id = self.wave_cursor_id
+        if cursor_id is not None:
+            last_x, last_h = self.last_cursor_geom
+            if h == last_h and abs(x - last_x) < 1.0:
+                return  # sub-pixel move; the line would land in the same place
+            canvas.coords(cursor_id, x, 0, x, h)
         else:
-            self.wave_cursor_id = self.wave_canvas.create_line(
+            self.wave_cursor_id = canvas.create_line(
                 x, 0, x, h,
                 fill="#ffcc00",
                 width=2,
                 tags="cursor",
             )
+        self.last_cursor_geom = (x, h)
+
+    def tick_cursor(self, pos: float):
+        """
+        Per-tick fast path used by the playback poller: only moves the
+        existing cursor line, using the position from the tick's snapshot.
+        Structural changes (resize, selection, tempo) go through
+        draw_waveform instead.
+        """
+        if self.wave_cursor_id is None:
+            return
+        self.draw_cursor(pos)
 
     def on_waveform_click(self, event):
-        if self.wave_canvas is None or self.waveform_duration <= 0:
+        dur = self.waveform_duration
+        if self.wave_canvas is None or dur <= 0:
             return
 
-        w = self.wave_canvas.winfo_width()
+        w, _h = self.get_wave_size()
         if w <= 1:
             return
 
         frac = event.x / float(w)
         frac = max(0.0, min(frac, 1.0))
-        new_pos = frac * self.waveform_duration
-        ctrl_pressed = bool(event.state & 0x0004)
-        alt_pressed = bool(event.state & 0x0008 or event.state & 0x20000)
+        new_pos = frac * dur
+        mods = event.state & (CTRL_STATE_MASK | ALT_STATE_MASK)
+        ctrl_pressed = bool(mods & CTRL_STATE_MASK)
+        alt_pressed = bool(mods & ALT_STATE_MASK)
 
-        if ctrl_pressed and alt_pressed:
-            self.player.reset_loop_points()
-            self.draw_waveform()
-            return
+        handler = self.WAVEFORM_CLICK_HANDLERS[(ctrl_pressed, alt_pressed)]
+        getattr(self, handler)(new_pos)
 
-        if ctrl_pressed:
-            if self.player.set_loop_start(new_pos):
-                self.draw_waveform()
-            return
+    def on_waveform_reset_loop(self, _pos: float):
+        self.player.reset_loop_points()
+        self.request_redraw()
 
-        if alt_pressed:
-            if self.player.set_loop_end(new_pos):
-                self.draw_waveform()
-            return
+    def on_waveform_set_loop_start(self, pos: float):
+        if self.player.set_loop_start(pos):
+            self.request_redraw()
+
+    def on_waveform_set_loop_end(self, pos: float):
+        if self.player.set_loop_end(pos):
+            self.request_redraw()
 
+    def on_waveform_seek(self, new_pos: float):
         self.append_log(f"Seeking to {new_pos:.2f} seconds")
         self.player.seek(new_pos)
+        self.wake_playback_ui()
         if self.play_pause_button is not None:
             self.play_pause_button.config(text="Pause")
 
@@ -1694,12 +2542,14 @@ class YTDemucsApp:
     def on_stop(self):
         self.player.stop()
         self.update_play_pause_button()
+        self.wake_playback_ui()
 
     def start_playback(self) -> bool:
         if not self.player.audio_ok or self.full_mix_path is None:
             return False
         self.player.play()
         self.update_play_pause_button()
+        self.wake_playback_ui()
         return True
 
     def pause_playback(self) -> bool:
@@ -1741,60 +2591,86 @@ class YTDemucsApp:
         self.update_loop_button()
         status = "enabled" if enabled else "disabled"
         self.append_log(f"Looping {status}.")
-        self.draw_waveform()
+        self.request_redraw()
 
     # ---------- RESET & CLEAR ----------
 
     def clear_current_session(self):
-        try:
-            self.player.stop()
-            self.player.stop_stream()
-        except Exception:
-            pass
-
-        self.player = StemAudioPlayer()
-        if not self.player.audio_ok:
-            self.append_log(f"Audio engine not available: {self.player.error_message}")
+        if self.player.audio_ok:
+            # Keep the output stream open for the next session
+            self.player.reset()
         else:
-            self.player.set_render_progress_callback(self.on_render_progress)
+            # Probe the devices again in case one has appeared since
+            try:
+                self.player.stop_stream()
+            except Exception:
+                pass
+            self.player = StemAudioPlayer()
+            if not self.player.audio_ok:
+                self.append_log(f"Audio engine not available: {self.player.error_message}")
+            else:
+                self.player.set_render_progress_callback(self.on_render_progress)
 
-        for w in self.player_frame.winfo_children():
-            w.destroy()
+        self.reset_player_frame()
 
         self.wave_canvas = None
         self.wave_cursor_id = None
+        self.wave_poly_id = None
+        self.last_wave_sig = None
+        self.wave_width = 0
+        self.wave_height = 0
         self.time_label = None
+        self.time_text_var = None
+        self.volume_text_var = None
+        self.speed_text_var = None
+        self.pitch_text_var = None
+        self.last_time_key = None
+        self.last_cursor_decisec = None
         self.play_pause_button = None
         self.stop_button = None
         self.loop_button = None
         self.volume_var = None
         self.volume_label = None
+        self.last_volume_pct = None
         self.speed_var = None
+        self.committed_speed = None
         self.speed_label = None
         self.pitch_var = None
+        self.committed_pitch = None
         self.pitch_label = None
+        self.last_speed_drag_value = None
+        self.last_pitch_drag_value = None
         self.all_var = None
         self.render_progress_var = None
         self.render_progress_label_var = None
         self.render_progress_bar = None
         self.render_progress_label = None
-        self.waveform_points = []
+        self.last_render_progress = None
+        self.set_waveform_points(())
+        self.envelope_cache.clear()
+        self.wave_coords_cache.clear()
         self.loop_start_line_id = None
         self.loop_end_line_id = None
-        self.waveform_duration = 0.0
+        self.set_waveform_duration(0.0)
         self.stem_vars.clear()
+        self.active_stem_names = set()
+        self.last_selection_sig = None
         self.full_mix_path = None
         self.current_title = None
         self.song_key_text = None
+        self.pitch_label_cache.clear()
         self.current_pipeline_result = None
         self.current_thumbnail_bytes = None
 
         self.thumbnail_image = None
+        self.thumbnail_generation += 1
         self.thumbnail_label.configure(image="", text="No\nthumbnail")
         self.gain_var.set(0.0)
         self.gain_label.config(text="+0.0 dB")
-        self.audio_meter.configure(value=0.0)
+        self.audio_meter.set_level(0.0)
         self.audio_meter_label.config(text="-∞ dB")
+        self.last_meter_value = 0.0
+        self.last_meter_text = "-∞ dB"
         self.player.set_gain_db(0.0)
         self.set_playback_controls_state(False)
         self.update_key_table()
@@ -1806,8 +2682,22 @@ class YTDemucsApp:
         Reset speed to 1x, pitch to +0.0 st, volume to 100%.
         Update both sliders/labels and underlying audio.
         """
-        self.player.set_loop_enabled(False)
-        self.player.reset_loop_points()
+        # a release still waiting to commit would undo the reset
+        self.cancel_release_commits()
+        self.player.apply_settings(
+            {
+                "loop_enabled": False,
+                "reset_loop": True,
+                "volume": 1.0,
+                "gain_db": 0.0,
+                "reverb_enabled": False,
+                "reverb_wet": 0.45,
+                "tempo_rate": 1.0,
+                "pitch_semitones": 0.0,
+            }
+        )
+        self.committed_speed = 1.0
+        self.committed_pitch = 0.0
         self.update_loop_button()
 
         # sliders
@@ -1826,30 +2716,25 @@ class YTDemucsApp:
 
         # labels
         if self.volume_label is not None:
-            self.volume_label.config(text="100%")
+            self.volume_text_var.set(PERCENT_LABELS[100])
+            self.last_volume_pct = 100
         if self.speed_label is not None:
-            self.speed_label.config(text="1.00x")
+            self.speed_text_var.set(format_speed(1.0))
         if self.pitch_label is not None:
-            self.pitch_label.config(text=self.format_pitch_label(0.0))
+            self.pitch_text_var.set(self.format_pitch_label(0.0))
         if self.gain_label is not None:
             self.gain_label.config(text="+0 dB")
         if self.reverb_mix_label is not None:
             self.reverb_mix_label.config(text="45% wet")
 
-        # audio engine
-        self.player.set_master_volume(1.0)
-        self.player.set_tempo_and_pitch(1.0, 0.0)
-        self.player.set_gain_db(0.0)
-        self.player.set_reverb_enabled(False)
-        self.player.set_reverb_wet(0.45)
         self.update_reverb_controls_state()
 
         self.update_key_table(0.0)
 
         # refresh duration & waveform
-        self.waveform_duration = self.player.get_duration()
+        self.set_waveform_duration(self.player.get_duration())
         self.update_waveform_from_selection()
-        self.draw_waveform()
+        self.request_redraw()
 
     def on_clear_app(self):
         """
@@ -1859,12 +2744,19 @@ class YTDemucsApp:
           - clear URL, log, thumbnail
           - reset skip separation, status, window title
         """
+        # Drop the selection first so clear_current_session's save-button
+        # refresh is the only one needed.
+        self.saved_sessions_listbox.selection_clear(0, tk.END)
+        self.selected_saved_session_id = None
+
         self.clear_current_session()
 
         # clear URL
         self.url_var.set("")
 
-        # clear log
+        # clear log, including lines still waiting for flush_log
+        with self.log_lock:
+            self.log_buffer.clear()
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.configure(state="disabled")
@@ -1873,93 +2765,135 @@ class YTDemucsApp:
         self.skip_sep_var.set(False)
         self.status_var.set("Idle")
 
-        self.saved_sessions_listbox.selection_clear(0, tk.END)
-        self.selected_saved_session_id = None
-        self.update_save_button_state()
-
         # reset window title
         self.root.title(self.base_title)
 
     # ---------- volume / speed / pitch / stems / "All" ----------
-    @staticmethod
-    def snap_speed(v: float) -> float:
-        preferred = [0.5, 0.75, 1.0, 1.25, 1.5]
-        threshold = 0.04
-        closest = min(preferred, key=lambda p: abs(p - v))
-        if abs(closest - v) <= threshold:
-            return closest
-        return v
-
-    def on_speed_drag(self, value: str):
-        if self.speed_label is None or self.speed_var is None:
+    def coalesce_drag(self, name: str, handler: Callable[[], None]):
+        """
+        Run a slider's drag handler at most once per DRAG_COALESCE_MS.
+        Trailing edge: the handler reads the variable when it fires, so the
+        last value written during the window always gets applied.
+        """
+        if name in self.drag_after_ids:
             return
-        try:
-            raw_v = float(value)
-        except ValueError:
-            raw_v = 1.0
 
-        snapped = self.snap_speed(raw_v)
-        if abs(snapped - raw_v) <= 0.04:
-            self.speed_var.set(snapped)
+        def _run():
+            self.drag_after_ids.pop(name, None)
+            handler()
+
+        self.drag_after_ids[name] = self.root.after(DRAG_COALESCE_MS, _run)
+
+    def on_speed_drag(self):
+        if self.speed_label is None or self.speed_var is None:
+            return
+        raw_v = self.speed_var.get()
+        if raw_v == self.last_speed_drag_value:
+            return
+        self.last_speed_drag_value = raw_v
+
+        snapped = snap_speed(raw_v)
+        if abs(snapped - raw_v) <= SPEED_SNAP_THRESHOLD:
+            # Writing back re-fires the trace; only do it when it changes
+            # the value so the second pass is a plain label update.
+            if snapped != raw_v:
+                self.speed_var.set(snapped)
             v = snapped
         else:
             v = raw_v
 
-        self.speed_label.config(text=f"{v:.2f}x")
+        self.speed_text_var.set(format_speed(v))
 
     def on_speed_release(self, event):
         if self.speed_var is None:
             return
         raw_v = float(self.speed_var.get())
-        v = self.snap_speed(raw_v)
+        v = snap_speed(raw_v)
         self.speed_var.set(v)
 
+        if self.speed_label is not None:
+            self.speed_text_var.set(format_speed(v))
+
+        # label now, engine + waveform once releases stop coming
+        self.schedule_release_commit("speed", partial(self.commit_speed, v))
+
+    def commit_speed(self, v: float):
+        if self.speed_var is None:
+            return  # player was cleared in the meantime
+        if v == self.committed_speed:
+            # released where it started: no tempo request, no redraw
+            return
+        self.committed_speed = v
+
         # tell the player to request the new tempo
         self.player.set_tempo_rate(v)
 
-        if self.speed_label is not None:
-            self.speed_label.config(text=f"{v:.2f}x")
-
         # optional: redraw waveform (time axis effectively changes)
-        self.draw_waveform()
-
-    @staticmethod
-    def snap_pitch(v: float) -> float:
-        """
-        Quantize to 1.0 semitone steps between -6 and +6.
-        """
-        snapped = round(v)
-        return max(-6.0, min(6.0, snapped))
+        self.request_redraw()
 
-    def on_pitch_drag(self, value: str):
+    def on_pitch_drag(self):
         if self.pitch_label is None or self.pitch_var is None:
             return
-        try:
-            raw_v = float(value)
-        except ValueError:
-            raw_v = 0.0
-
-        snapped = self.snap_pitch(raw_v)
-        self.pitch_var.set(snapped)
+        raw_v = self.pitch_var.get()
+
+        snapped = snap_pitch(raw_v)
+        if snapped != raw_v:
+            self.pitch_var.set(snapped)
+            return  # the write re-fires this trace with the snapped value
+        if snapped == self.last_pitch_drag_value:
+            # Every small motion lands back on the same semitone; the label
+            # and key table already show it.
+            return
+        self.last_pitch_drag_value = snapped
         if self.pitch_label is not None:
-            self.pitch_label.config(text=self.format_pitch_label(snapped))
+            self.pitch_text_var.set(self.format_pitch_label(snapped))
         self.update_key_table(snapped)
 
     def on_pitch_release(self, event):
         if self.pitch_var is None:
             return
-        semitones = self.snap_pitch(float(self.pitch_var.get()))
+        semitones = snap_pitch(float(self.pitch_var.get()))
         self.pitch_var.set(semitones)
-        self.player.set_pitch_semitones(semitones)
 
+        # labels now, engine + waveform once releases stop coming
         if self.pitch_label is not None:
-            self.pitch_label.config(text=self.format_pitch_label(semitones))
-
+            self.pitch_text_var.set(self.format_pitch_label(semitones))
         self.update_key_table(semitones)
 
-        self.waveform_duration = self.player.get_duration()
+        self.schedule_release_commit("pitch", partial(self.commit_pitch, semitones))
+
+    def schedule_release_commit(self, name: str, commit: Callable[[], None]):
+        """
+        Run a slider's release commit once releases have been quiet for
+        RELEASE_COMMIT_DELAY_MS; a newer release replaces the pending one.
+        """
+        pending = self.release_commit_after_ids.pop(name, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+
+        def _run():
+            self.release_commit_after_ids.pop(name, None)
+            commit()
+
+        self.release_commit_after_ids[name] = self.root.after(
+            RELEASE_COMMIT_DELAY_MS, _run
+        )
+
+    def cancel_release_commits(self):
+        for after_id in self.release_commit_after_ids.values():
+            self.root.after_cancel(after_id)
+        self.release_commit_after_ids.clear()
+
+    def commit_pitch(self, semitones: float):
+        if self.pitch_var is None:
+            return  # player was cleared in the meantime
+        if semitones == self.committed_pitch:
+            return  # released where it started
+        self.committed_pitch = semitones
+        self.player.set_pitch_semitones(semitones)
+        self.set_waveform_duration(self.player.get_duration())
         self.update_waveform_from_selection()
-        self.draw_waveform()
+        self.request_redraw()
 
     @staticmethod
     def snap_gain(value: float) -> float:
@@ -1967,19 +2901,23 @@ class YTDemucsApp:
             return 0.0
         return max(-10.0, min(10.0, value))
 
-    def on_gain_change(self, value: str):
-        try:
-            raw = float(value)
-        except ValueError:
-            raw = 0.0
+    def on_gain_change(self):
+        raw = self.gain_var.get()
 
         snapped = self.snap_gain(raw)
         if abs(snapped - raw) <= 0.15:
-            self.gain_var.set(snapped)
+            if snapped != raw:
+                self.gain_var.set(snapped)
+                return  # the write re-fires this trace with the snapped value
             gain = snapped
         else:
             gain = raw
 
+        # Slider jitter re-emits values that round to the gain already
+        # applied; skip the engine and label update for those.
+        if abs(gain - self.player.gain_db) < 1e-4:
+            return
+
         self.player.set_gain_db(gain)
         if self.gain_label is not None:
             self.gain_label.config(text=f"{gain:+.1f} dB")
@@ -1999,15 +2937,11 @@ class YTDemucsApp:
         self.player.set_reverb_enabled(enabled)
         self.update_reverb_controls_state()
 
-    def on_reverb_mix_change(self, value: str):
-        try:
-            wet = float(value)
-        except ValueError:
-            wet = 0.0
-
-        wet = max(0.0, min(1.0, wet))
-        if self.reverb_mix_var is not None:
-            self.reverb_mix_var.set(wet)
+    def on_reverb_mix_change(self):
+        if self.reverb_mix_var is None:
+            return
+        wet = max(0.0, min(1.0, self.reverb_mix_var.get()))
+        self.reverb_mix_var.set(wet)
         self.player.set_reverb_wet(wet)
         if self.reverb_mix_label is not None:
             pct = int(round(wet * 100))
@@ -2043,11 +2977,25 @@ class YTDemucsApp:
         self.set_reverb_enabled_from_master(not self.get_reverb_enabled())
 
 
-    def on_stem_toggle(self):
+    def selection_signature(self) -> tuple[bool, frozenset[str]]:
+        play_all = self.all_var is not None and bool(self.all_var.get())
+        return play_all, frozenset(self.active_stem_names)
+
+    def apply_selection_change(self):
+        # toggles that leave the selection as it was skip the player + redraw
+        if self.selection_signature() == self.last_selection_sig:
+            return
+        self.update_waveform_from_selection()
+        self.request_redraw()
+
+    def on_stem_toggle(self, stem_name: str):
+        if self.stem_vars[stem_name].get():
+            self.active_stem_names.add(stem_name)
+        else:
+            self.active_stem_names.discard(stem_name)
         if self.all_var is not None:
             self.all_var.set(False)
-        self.update_waveform_from_selection()
-        self.draw_waveform()
+        self.apply_selection_change()
 
     def on_all_toggle(self):
         if self.all_var is None:
@@ -2055,18 +3003,17 @@ class YTDemucsApp:
         if self.all_var.get():
             for var in self.stem_vars.values():
                 var.set(False)
-        self.update_waveform_from_selection()
-        self.draw_waveform()
+            self.active_stem_names.clear()
+        self.apply_selection_change()
 
-    def on_volume_change(self, value: str):
+    def on_volume_change(self):
         """
         Live volume update while dragging the slider.
         Also keeps the 'xx%' label in sync.
         """
-        try:
-            v = float(value)
-        except ValueError:
-            v = 1.0
+        if self.volume_var is None:
+            return
+        v = self.volume_var.get()
 
         # Clamp to [0, 1] just in case
         v = max(0.0, min(1.0, v))
@@ -2074,7 +3021,9 @@ class YTDemucsApp:
 
         if self.volume_label is not None:
             pct = int(v * 100)
-            self.volume_label.config(text=f"{pct}%")
+            if pct != self.last_volume_pct:
+                self.volume_text_var.set(PERCENT_LABELS[pct])
+                self.last_volume_pct = pct
 
     def get_master_volume(self) -> float:
         try:
@@ -2083,76 +3032,165 @@ class YTDemucsApp:
             return 0.0
 
     def set_master_volume_from_master(self, volume: float):
-        if self.volume_var is not None:
-            self.volume_var.set(volume)
-        self.on_volume_change(str(volume))
+        if self.volume_var is None:
+            self.player.set_master_volume(volume)
+            return
+        # the volume_var write trace pushes the value to the player
+        self.volume_var.set(volume)
 
 
     # ---------- render progress ----------
 
     def on_render_progress(self, progress: float, label: str):
-        def _update():
-            if (
-                self.render_progress_var is None
-                or self.render_progress_label_var is None
-            ):
+        """
+        Render-thread callback. Only the latest value is kept; the bar is
+        refreshed at most every RENDER_PROGRESS_INTERVAL_MS.
+        """
+        with self.render_progress_lock:
+            self.render_progress_latest = (progress, label)
+            if self.render_progress_scheduled:
                 return
+            self.render_progress_scheduled = True
+        self.root.after(RENDER_PROGRESS_INTERVAL_MS, self.flush_render_progress)
+
+    def flush_render_progress(self):
+        with self.render_progress_lock:
+            latest = self.render_progress_latest
+            self.render_progress_latest = None
+            self.render_progress_scheduled = False
+        if (
+            latest is None
+            or self.render_progress_var is None
+            or self.render_progress_label_var is None
+        ):
+            return
 
-            try:
-                pct = max(0.0, min(float(progress), 1.0)) * 100.0
-            except (TypeError, ValueError):
-                pct = 0.0
-            self.render_progress_var.set(pct)
+        progress, label = latest
+        try:
+            pct = int(max(0.0, min(float(progress), 1.0)) * 100.0)
+        except (TypeError, ValueError):
+            pct = 0
+        text = label.strip() if label else "Ready"
 
-            text = label.strip() if label else "Ready"
-            self.render_progress_label_var.set(f"Rendering: {text}")
+        last = self.last_render_progress
+        if last is not None and last == (pct, text):
+            return
+        self.last_render_progress = (pct, text)
 
-        self.root.after(0, _update)
+        if last is None or last[0] != pct:
+            self.render_progress_var.set(pct)
+        if last is None or last[1] != text:
+            self.render_progress_label_var.set(f"Rendering: {text}")
 
 
     # ---------- periodic UI ----------
 
+    def is_transport_active(self) -> bool:
+        return self.player.is_playing and not self.player.is_paused
+
+    def wake_playback_ui(self):
+        """
+        Run the transport tick now and return to the fast cadence, e.g.
+        right after playback starts while the poller is backed off.
+        """
+        if self.playback_ui_after_id is not None:
+            self.root.after_cancel(self.playback_ui_after_id)
+            self.playback_ui_after_id = None
+        self.playback_ui_idle_delay_ms = PLAYBACK_UI_INTERVAL_MS
+        self.playback_ui_deadline = None
+        self.update_playback_ui()
+
     def update_playback_ui(self):
+        """
+        Transport tick: time label, play button and cursor. Runs every
+        PLAYBACK_UI_INTERVAL_MS while playing (scheduled against a monotonic
+        deadline, so the cadence does not drift) and backs off exponentially
+        (up to PLAYBACK_UI_IDLE_MAX_MS) while stopped or paused.
+        """
+        self.playback_ui_after_id = None
+        if self.root.state() == "iconic":
+            self.playback_ui_deadline = None
+            self.playback_ui_after_id = self.root.after(
+                HIDDEN_UI_INTERVAL_MS, self.update_playback_ui
+            )
+            return
         try:
+            snap = self.player.snapshot()
             # Always get the true duration from the audio engine
-            duration = self.player.get_duration()
-            self.waveform_duration = duration
+            duration = snap.duration
+            self.set_waveform_duration(duration)
 
+            pos = 0.0
             if self.time_label is not None and duration > 0:
-                pos = self.player.get_position()
-                pos = max(0.0, min(pos, duration))
-                elapsed_str = self.format_time(pos)
-                total_str = self.format_time(duration)
-                self.time_label.config(text=f"{elapsed_str} / {total_str}")
-
-            level = self.player.get_output_level()
-            if self.audio_meter is not None:
-                self.audio_meter.configure(value=max(0.0, min(level, 1.0)))
-            if self.audio_meter_label is not None:
-                if level <= 1e-6:
-                    db_text = "-∞ dB"
-                else:
-                    db = max(-60.0, 20 * math.log10(level))
-                    db_text = f"{db:.1f} dB"
-                self.audio_meter_label.config(text=db_text)
+                pos = max(0.0, min(snap.position, duration))
+                time_key = (int(pos), int(duration))
+                if time_key != self.last_time_key:
+                    # only format when the seconds bucket changes
+                    self.time_text_var.set(
+                        f"{format_time(time_key[0])} / {format_time(time_key[1])}"
+                    )
+                    self.last_time_key = time_key
 
             if (
                 self.play_pause_button is not None
-                and not self.player.is_playing
-                and not self.player.is_paused
+                and not snap.is_playing
+                and not snap.is_paused
             ):
                 self.play_pause_button.config(text="Play")
 
-            self.draw_cursor()
+            cursor_decisec = int(pos * 10)
+            if cursor_decisec != self.last_cursor_decisec:
+                self.last_cursor_decisec = cursor_decisec
+                self.tick_cursor(snap.position)
         finally:
-            self.root.after(100, self.update_playback_ui)
-
+            if self.is_transport_active():
+                now = time.monotonic()
+                interval = PLAYBACK_UI_INTERVAL_MS / 1000
+                deadline = self.playback_ui_deadline
+                # resuming, or stalled for more than a whole tick: restart
+                # the cadence from now rather than firing a burst to catch up
+                if deadline is None or deadline < now - interval:
+                    deadline = now
+                deadline += interval
+                self.playback_ui_deadline = deadline
+                delay = max(1, int((deadline - now) * 1000))
+                self.playback_ui_idle_delay_ms = PLAYBACK_UI_INTERVAL_MS
+            else:
+                self.playback_ui_deadline = None
+                delay = self.playback_ui_idle_delay_ms
+                self.playback_ui_idle_delay_ms = min(delay * 2, PLAYBACK_UI_IDLE_MAX_MS)
+            self.playback_ui_after_id = self.root.after(delay, self.update_playback_ui)
 
-    @staticmethod
-    def format_time(seconds: float) -> str:
-        seconds = int(seconds)
-        m, s = divmod(seconds, 60)
-        return f"{m:02d}:{s:02d}"
+    @classmethod
+    def level_to_db_text(cls, level: float) -> str:
+        if level <= cls.METER_SILENCE_LEVEL:
+            return "-∞ dB"
+        if level <= cls.METER_FLOOR_LEVEL:
+            return cls.METER_FLOOR_TEXT
+        return f"{20.0 * math.log10(level):.1f} dB"
+
+    def update_meter_ui(self):
+        """
+        Meter tick: output level only. Fast while playing; while idle the
+        level is zero, so it only needs an occasional refresh.
+        """
+        if self.root.state() == "iconic":
+            self.root.after(HIDDEN_UI_INTERVAL_MS, self.update_meter_ui)
+            return
+        try:
+            level = self.player.get_output_level()
+            meter_value = round(max(0.0, min(level, 1.0)) * 200) / 200
+            if self.audio_meter is not None and meter_value != self.last_meter_value:
+                self.audio_meter.set_level(meter_value)
+                self.last_meter_value = meter_value
+            if self.audio_meter_label is not None:
+                db_text = self.level_to_db_text(level)
+                if db_text != self.last_meter_text:
+                    self.audio_meter_label.config(text=db_text)
+                    self.last_meter_text = db_text
+        finally:
+            delay = METER_UI_INTERVAL_MS if self.is_transport_active() else METER_UI_IDLE_MS
+            self.root.after(delay, self.update_meter_ui)
 
     def format_pitch_label(self, semitones: float) -> str:
         """
@@ -2164,39 +3202,19 @@ class YTDemucsApp:
 
         No recomputation of the actual key — purely a musical transposition.
         """
-        sign = "+" if semitones >= 0 else ""
-        pitch_part = f"{sign}{semitones}"
+        pitch_part = format_pitch_part(semitones)
+        cache_key = (self.song_key_text, pitch_part)
+        label = self.pitch_label_cache.get(cache_key)
+        if label is not None:
+            return label
 
         current_key = self.get_current_key_text(semitones)
-        if not current_key:
-            return pitch_part
-
-        return f"{pitch_part} |  {current_key}"
-
-    @staticmethod
-    def normalize_mode(mode_raw: str) -> str:
-        mode_lower = mode_raw.lower()
-        if "min" in mode_lower:
-            return "minor"
-        if "maj" in mode_lower:
-            return "major"
-        return mode_raw
-
-    def parse_key_text(self, key_text: str) -> tuple[int, str] | None:
-        parts = key_text.split()
-        if len(parts) < 2:
-            return None
-
-        tonic_raw = parts[0]
-        mode_raw = " ".join(parts[1:])
-        tonic = FLAT_TO_SHARP.get(tonic_raw, tonic_raw)
-
-        try:
-            tonic_index = CHROMA_LABELS.index(tonic)
-        except ValueError:
-            return None
+        label = f"{pitch_part} |  {current_key}" if current_key else pitch_part
+        self.pitch_label_cache[cache_key] = label
+        return label
 
-        return tonic_index, self.normalize_mode(mode_raw)
+    normalize_mode = staticmethod(normalize_mode)
+    parse_key_text = staticmethod(parse_key_text)
 
     def get_current_key_text(self, semitones: float | None = None) -> str | None:
         base_key = self.song_key_text
@@ -2222,6 +3240,9 @@ class YTDemucsApp:
 
     @staticmethod
     def transpose_parsed_key(tonic_index: int, mode_raw: str, semitone_steps: int) -> str:
+        table = TRANSPOSED_KEYS.get(mode_raw)
+        if table is not None:
+            return table[tonic_index][semitone_steps % 12]
         new_index = (tonic_index + semitone_steps) % 12
         new_tonic = CHROMA_LABELS[new_index]
         return f"{new_tonic} {mode_raw}"
@@ -2230,13 +3251,9 @@ class YTDemucsApp:
         mode_lower = mode_raw.lower()
         if "minor" in mode_lower:
             # Relative major is a minor third up
-            rel_index = (tonic_index + 3) % 12
-            rel_mode = "major"
-        else:
-            # Relative minor is a minor third down
-            rel_index = (tonic_index + 9) % 12
-            rel_mode = "minor"
-        return f"{CHROMA_LABELS[rel_index]} {rel_mode}"
+            return TRANSPOSED_KEYS["major"][tonic_index][3]
+        # Relative minor is a minor third down
+        return TRANSPOSED_KEYS["minor"][tonic_index][9]
 
     def compute_key_table_values(self, semitones: float | None = None) -> dict[str, str]:
         default_text = "N/A"
@@ -2323,16 +3340,11 @@ class MasterWindow:
         # Volume label directly under "Master"
         self.master_volume_label = ttk.Label(self.master_frame, text="100%")
         self.master_volume_label.grid(row=1, column=0, columnspan=2, pady=(0, 6))
+        self.last_master_volume_pct: int | None = None
 
-        self.master_meter = ttk.Progressbar(
-            self.master_frame,
-            orient="vertical",
-            mode="determinate",
-            maximum=1.0,
-            value=0.0,
-            length=160,
-        )
+        self.master_meter = LevelMeter(self.master_frame, orient="vertical", length=160)
         self.master_meter.grid(row=2, column=0, sticky="ns", padx=(10, 3))
+        self.last_master_meter_value: float | None = None
 
         self.master_volume_var = tk.DoubleVar(value=StemAudioPlayer.get_global_master_volume())
         self.master_volume_slider = ttk.Scale(
@@ -2360,6 +3372,10 @@ class MasterWindow:
             self.master_frame, text="Stop All", width=13, command=self.on_master_stop_all
         )
         self.master_stop_button.grid(row=5, column=0, columnspan=2, sticky="ew")
+        # last values written to the master buttons
+        self.last_master_play_text: str | None = None
+        self.last_master_mute_text: str | None = None
+        self.last_master_mute_enabled: bool | None = None
 
         self.update_master_volume_label()
 
@@ -2370,7 +3386,16 @@ class MasterWindow:
         self.last_paused_sessions: set[YTDemucsApp] = set()
         self.pause_targets: set[YTDemucsApp] = set()
         self.solo_target: YTDemucsApp | None = None
+        # Sessions whose solo muting needs re-applying; solo_dirty_all
+        # covers a change of solo target, which affects every session.
+        self.solo_dirty: set[YTDemucsApp] = set()
+        self.solo_dirty_all = False
         self.master_muted_sessions: set[YTDemucsApp] = set()
+        # (func, args, kwargs) collected during an update_loop tick; None
+        # outside a tick so event handlers write straight through.
+        self.pending_writes: list[tuple[Callable, tuple, dict]] | None = None
+        # Detached session columns kept around for reuse
+        self.session_column_pool: list[dict] = []
 
         self.refresh_sessions()
         self.update_loop()
@@ -2397,7 +3422,8 @@ class MasterWindow:
         for app in list(self.session_states.keys()):
             if app not in active_apps:
                 state = self.session_states.pop(app)
-                state["frame"].destroy()
+                self.release_session_column(state)
+                self.solo_dirty.discard(app)
                 self.pause_targets.discard(app)
                 self.master_muted_sessions.discard(app)
 
@@ -2411,51 +3437,90 @@ class MasterWindow:
         return active_apps
 
     def build_session_column(self, app: YTDemucsApp) -> dict:
-        frame = ttk.Frame(self.table_frame, padding=5)
-        name_label = ttk.Label(
-            frame,
-            text=self.format_session_name(app.get_session_display_name()),
-            font=self.title_font,
+        if self.session_column_pool:
+            state = self.session_column_pool.pop()
+        else:
+            state = self.create_session_column()
+        self.bind_session_column(state, app)
+        return state
+
+    def release_session_column(self, state: dict):
+        """Detach a column; keep its widgets for the next session to reuse."""
+        if len(self.session_column_pool) >= SESSION_COLUMN_POOL_SIZE:
+            state["frame"].destroy()
+            return
+        state["frame"].grid_forget()
+        self.session_column_pool.append(state)
+
+    def bind_session_column(self, state: dict, app: YTDemucsApp):
+        """Point a (new or pooled) column's widgets at ``app``."""
+        state.update(
+            {
+                "muted": False,
+                "saved_volume": None,
+                "solo_restore_volume": None,
+                "updating_volume": True,
+                # last values written to the widgets, to skip no-op Tk calls
+                "last_name_text": None,
+                "last_solo_text": None,
+                "last_time_key": None,
+                "last_play_text": None,
+                "last_meter_value": None,
+                "last_reverb_text": None,
+                "last_reverb_enabled": None,
+            }
         )
+        state["volume_var"].set(app.get_master_volume())
+        state["updating_volume"] = False
+
+        state["name_label"].configure(
+            text=self.format_session_name(app.get_session_display_name())
+        )
+        state["time_label"].configure(text="00:00 / 00:00")
+        state["meter"].set_level(0.0)
+        state["slider"].configure(command=partial(self.on_volume_slider, app))
+        state["mute_btn"].configure(text="M", command=partial(self.toggle_mute, app))
+        state["solo_btn"].configure(text="S", command=partial(self.toggle_solo, app))
+        state["play_btn"].configure(text="Play", command=partial(self.toggle_session_play, app))
+        state["stop_btn"].configure(command=partial(self.stop_session, app))
+        state["reverb_btn"].configure(text="Reverb", command=partial(self.toggle_reverb, app))
+        self.solo_dirty.add(app)
+
+    def create_session_column(self) -> dict:
+        frame = ttk.Frame(self.table_frame, padding=5)
+        name_label = ttk.Label(frame, font=self.title_font)
         name_label.grid(row=0, column=0, columnspan=2, pady=(0, 2))
 
         time_label = ttk.Label(frame, text="00:00 / 00:00")
         time_label.grid(row=1, column=0, columnspan=2, pady=(0, 6))
 
-        meter = ttk.Progressbar(
-            frame, orient="vertical", mode="determinate", maximum=1.0, value=0.0, length=120
-        )
+        meter = LevelMeter(frame, orient="vertical", length=120)
         meter.grid(row=2, column=0, sticky="ns", padx=(0, 6))
 
-        volume_var = tk.DoubleVar(value=app.get_master_volume())
+        volume_var = tk.DoubleVar(value=1.0)
         slider = ttk.Scale(
             frame,
             from_=1.0,
             to=0.0,
             orient="vertical",
             variable=volume_var,
-            command=lambda v, target=app: self.on_volume_slider(target, v),
             length=140,
         )
         slider.grid(row=2, column=1, sticky="ns")
 
-        mute_btn = ttk.Button(frame, text="M", width=2, command=lambda a=app: self.toggle_mute(a))
+        mute_btn = ttk.Button(frame, text="M", width=2)
         mute_btn.grid(row=3, column=0, sticky="ew", pady=(8, 2))
 
-        solo_btn = ttk.Button(frame, text="S", width=2, command=lambda a=app: self.toggle_solo(a))
+        solo_btn = ttk.Button(frame, text="S", width=2)
         solo_btn.grid(row=3, column=1, sticky="ew", pady=(8, 2))
 
-        play_btn = ttk.Button(frame, text="Play", command=lambda a=app: self.toggle_session_play(a))
+        play_btn = ttk.Button(frame, text="Play")
         play_btn.grid(row=4, column=0, columnspan=2, sticky="ew", pady=(2, 0))
 
-        stop_btn = ttk.Button(frame, text="Stop", command=lambda a=app: self.stop_session(a))
+        stop_btn = ttk.Button(frame, text="Stop")
         stop_btn.grid(row=5, column=0, columnspan=2, sticky="ew", pady=(2, 0))
 
-        reverb_btn = ttk.Button(
-            frame,
-            text="Reverb",
-            command=lambda a=app: self.toggle_reverb(a),
-        )
+        reverb_btn = ttk.Button(frame, text="Reverb")
         reverb_btn.grid(row=6, column=0, columnspan=2, sticky="ew", pady=(2, 0))
 
         frame.columnconfigure(0, weight=1)
@@ -2467,15 +3532,12 @@ class MasterWindow:
             "time_label": time_label,
             "meter": meter,
             "volume_var": volume_var,
+            "slider": slider,
             "mute_btn": mute_btn,
             "solo_btn": solo_btn,
             "play_btn": play_btn,
             "stop_btn": stop_btn,
             "reverb_btn": reverb_btn,
-            "muted": False,
-            "saved_volume": None,
-            "solo_restore_volume": None,
-            "updating_volume": False,
         }
 
     # ---------- interactions ----------
@@ -2503,6 +3565,7 @@ class MasterWindow:
             state["mute_btn"].config(text="M")
             state["saved_volume"] = None
             self.master_muted_sessions.discard(app)
+            self.solo_dirty.add(app)
             self.enforce_solo_rules()
 
         if self.solo_target and app is not self.solo_target and volume > 0.0:
@@ -2532,6 +3595,7 @@ class MasterWindow:
             self.set_session_volume(app, restore)
             self.master_muted_sessions.discard(app)
 
+        self.solo_dirty.add(app)
         self.enforce_solo_rules()
 
     def toggle_mute(self, app: YTDemucsApp):
@@ -2546,10 +3610,12 @@ class MasterWindow:
             self.clear_solo()
         else:
             self.solo_target = app
+            self.solo_dirty_all = True
             self.enforce_solo_rules()
 
     def clear_solo(self):
         self.solo_target = None
+        self.solo_dirty_all = True
         self.enforce_solo_rules()
 
     def toggle_reverb(self, app: YTDemucsApp):
@@ -2559,9 +3625,20 @@ class MasterWindow:
         self.update_reverb_button(app)
 
     def enforce_solo_rules(self):
-        for app, state in self.session_states.items():
+        """Re-apply solo muting to the sessions marked dirty."""
+        if self.solo_dirty_all:
+            apps = list(self.session_states)
+        else:
+            apps = [app for app in self.solo_dirty if app in self.session_states]
+        self.solo_dirty.clear()
+        self.solo_dirty_all = False
+
+        for app in apps:
+            state = self.session_states[app]
             is_target = app is self.solo_target
-            state["solo_btn"].config(text="-S" if is_target else "S")
+            self.set_text_if_changed(
+                state, "last_solo_text", state["solo_btn"], "-S" if is_target else "S"
+            )
 
             if self.solo_target is None:
                 if not state.get("muted") and state.get("solo_restore_volume") is not None:
@@ -2661,12 +3738,29 @@ class MasterWindow:
 
         volume = max(0.0, min(volume, 1.0))
         StemAudioPlayer.set_global_master_volume(volume)
-        self.master_volume_var.set(volume)
+        if abs(self.master_volume_var.get() - volume) >= VOLUME_EPSILON:
+            self.master_volume_var.set(volume)
         self.update_master_volume_label()
 
     # ---------- updates ----------
 
-    def update_master_play_button(self):
+    @staticmethod
+    def scan_sessions() -> tuple[bool, bool]:
+        """One pass over all app windows: (any_active, any_playing)."""
+        any_active = False
+        any_playing = False
+        for app in YTDemucsApp.instances:
+            if not app.has_active_session():
+                continue
+            if app.player.audio_ok:
+                any_active = True
+            if app.get_playback_state() == "playing":
+                any_playing = True
+            if any_active and any_playing:
+                break
+        return any_active, any_playing
+
+    def update_master_play_button(self, any_playing: bool | None = None):
         self.pause_targets = {
             app
             for app in self.pause_targets
@@ -2678,21 +3772,23 @@ class MasterWindow:
         if self.pause_targets:
             text = "Resume Paused"
         else:
-            any_playing = any(
-                app.has_active_session() and app.get_playback_state() == "playing"
-                for app in YTDemucsApp.instances
-            )
+            if any_playing is None:
+                any_playing = self.scan_sessions()[1]
             text = "Pause Playing" if any_playing else "Play All"
 
-        self.master_play_button.config(text=text)
+        if text != self.last_master_play_text:
+            self.master_play_button.config(text=text)
+            self.last_master_play_text = text
 
-    def update_master_mute_button(self):
-        any_active = any(app.has_active_session() and app.player.audio_ok for app in YTDemucsApp.instances)
+    def update_master_mute_button(self, any_active: bool | None = None):
+        if any_active is None:
+            any_active = self.scan_sessions()[0]
+        if any_active != self.last_master_mute_enabled:
+            self.master_mute_button.state(["!disabled"] if any_active else ["disabled"])
+            self.last_master_mute_enabled = any_active
         if not any_active:
-            self.master_mute_button.state(["disabled"])
             return
 
-        self.master_mute_button.state(["!disabled"])
         any_muted = any(state.get("muted") for state in self.session_states.values())
 
         if self.master_muted_sessions:
@@ -2702,91 +3798,179 @@ class MasterWindow:
         else:
             text = "Mute All"
 
-        self.master_mute_button.config(text=text)
+        if text != self.last_master_mute_text:
+            self.master_mute_button.config(text=text)
+            self.last_master_mute_text = text
 
     def update_master_volume_label(self):
         pct = int(max(0.0, min(self.master_volume_var.get(), 1.0)) * 100)
-        self.master_volume_label.config(text=f"{pct}%")
+        if pct != self.last_master_volume_pct:
+            self.master_volume_label.config(text=PERCENT_LABELS[pct])
+            self.last_master_volume_pct = pct
 
     @staticmethod
-    def compute_master_level(levels: list[float]) -> float:
-        power = sum(max(0.0, l) ** 2 for l in levels)
-        return max(0.0, min(math.sqrt(power), 1.0))
+    def compute_master_level(sum_of_squares: float) -> float:
+        return math.sqrt(min(1.0, max(0.0, sum_of_squares)))
+
+    def queue_write(self, func: Callable, *args, **kwargs):
+        if self.pending_writes is None:
+            func(*args, **kwargs)
+        else:
+            self.pending_writes.append((func, args, kwargs))
+
+    def queue_configure(self, widget: tk.Widget, **options):
+        self.queue_write(widget.configure, **options)
+
+    def flush_widget_writes(self):
+        writes = self.pending_writes
+        self.pending_writes = None
+        if not writes:
+            return
+        for func, args, kwargs in writes:
+            func(*args, **kwargs)
+        self.window.update_idletasks()
+
+    def set_text_if_changed(self, state: dict, cache_key: str, widget: tk.Widget, text: str):
+        if state.get(cache_key) == text:
+            return
+        self.queue_configure(widget, text=text)
+        state[cache_key] = text
 
     def update_reverb_button(self, app: YTDemucsApp):
         state = self.session_states.get(app)
         if not state:
             return
         enabled = app.get_reverb_enabled()
-        try:
-            if app.playback_enabled:
-                state["reverb_btn"].state(["!disabled"])
-            else:
-                state["reverb_btn"].state(["disabled"])
-        except Exception:
+        playback_enabled = app.playback_enabled
+        if state.get("last_reverb_enabled") != playback_enabled:
             try:
-                state["reverb_btn"].configure(
-                    state="normal" if app.playback_enabled else "disabled"
-                )
+                if playback_enabled:
+                    state["reverb_btn"].state(["!disabled"])
+                else:
+                    state["reverb_btn"].state(["disabled"])
             except Exception:
-                pass
-        state["reverb_btn"].config(text=f"Reverb ({'On' if enabled else 'Off'})")
+                try:
+                    state["reverb_btn"].configure(
+                        state="normal" if playback_enabled else "disabled"
+                    )
+                except Exception:
+                    pass
+            state["last_reverb_enabled"] = playback_enabled
+        self.set_text_if_changed(
+            state,
+            "last_reverb_text",
+            state["reverb_btn"],
+            f"Reverb ({'On' if enabled else 'Off'})",
+        )
 
     def update_loop(self):
         if not self.window.winfo_exists():
             return
 
+        if self.window.state() == "iconic" or not self.window.winfo_viewable():
+            # Nothing on screen to refresh; keep solo muting applied to
+            # the players and check again later.
+            if self.solo_target is not None:
+                self.solo_dirty_all = True
+            if self.solo_dirty or self.solo_dirty_all:
+                self.enforce_solo_rules()
+            self.window.after(MASTER_HIDDEN_INTERVAL_MS, self.update_loop)
+            return
+
+        self.pending_writes = []
+        try:
+            self.update_session_rows()
+        finally:
+            self.flush_widget_writes()
+        self.window.after(MASTER_UI_INTERVAL_MS, self.update_loop)
+
+    def update_session_rows(self):
         active_apps = self.refresh_sessions()
-        levels: list[float] = []
+        level_sumsq = 0.0
+        # Master button inputs, gathered in the same pass as the rows
+        any_active = False
+        any_playing = False
         for app in active_apps:
             state = self.session_states.get(app)
             if not state:
                 continue
 
-            state["name_label"].config(
-                text=self.format_session_name(app.get_session_display_name())
+            self.set_text_if_changed(
+                state,
+                "last_name_text",
+                state["name_label"],
+                self.format_session_name(app.get_session_display_name()),
             )
 
             try:
-                level = max(0.0, min(app.player.get_output_level(), 1.0))
+                snap = app.player.snapshot()
             except Exception:
-                level = 0.0
-            levels.append(level)
-            state["meter"].configure(value=level)
+                snap = None
+
+            level = max(0.0, min(snap.output_level, 1.0)) if snap is not None else 0.0
+            level_sumsq += level * level
+            # Quantize so sub-pixel level changes don't force a redraw.
+            meter_value = round(level * 200) / 200
+            if state.get("last_meter_value") != meter_value:
+                self.queue_write(state["meter"].set_level, meter_value)
+                state["last_meter_value"] = meter_value
 
             if not state.get("updating_volume"):
                 current_volume = app.get_master_volume()
-                state["updating_volume"] = True
-                state["volume_var"].set(current_volume)
-                state["updating_volume"] = False
-
-            try:
-                duration = app.player.get_duration()
-                pos = max(0.0, min(app.player.get_position(), duration))
-                elapsed_str = YTDemucsApp.format_time(pos)
-                total_str = YTDemucsApp.format_time(duration)
-                state["time_label"].config(text=f"{elapsed_str} / {total_str}")
-            except Exception:
-                state["time_label"].config(text="00:00 / 00:00")
-
-            playback_state = app.get_playback_state()
-            if playback_state == "playing":
-                state["play_btn"].config(text="Pause")
-            elif playback_state == "paused":
-                state["play_btn"].config(text="Resume")
+                if (
+                    current_volume > 0.0
+                    and self.solo_target is not None
+                    and app is not self.solo_target
+                    and not state.get("muted")
+                ):
+                    # Raised from the session's own window while soloed
+                    self.solo_dirty.add(app)
+                volume_var = state["volume_var"]
+                if abs(volume_var.get() - current_volume) >= VOLUME_EPSILON:
+                    state["updating_volume"] = True
+                    volume_var.set(current_volume)
+                    state["updating_volume"] = False
+
+            if snap is not None:
+                duration = snap.duration
+                pos = max(0.0, min(snap.position, duration))
+                time_key = (int(pos), int(duration))
             else:
-                state["play_btn"].config(text="Play")
+                time_key = (0, 0)
+            # whole seconds are compared first; strings are only built on change
+            if time_key != state["last_time_key"]:
+                self.queue_configure(
+                    state["time_label"],
+                    text=f"{format_time(time_key[0])} / {format_time(time_key[1])}",
+                )
+                state["last_time_key"] = time_key
+
+            if app.player.audio_ok:
+                any_active = True
+            if snap is None or not snap.is_playing:
+                play_text = "Play"
+            elif snap.is_paused:
+                play_text = "Resume"
+            else:
+                play_text = "Pause"
+                any_playing = True
+            self.set_text_if_changed(state, "last_play_text", state["play_btn"], play_text)
 
             self.update_reverb_button(app)
 
-        self.enforce_solo_rules()
-        self.update_master_mute_button()
-        self.update_master_play_button()
+        if self.solo_dirty or self.solo_dirty_all:
+            self.enforce_solo_rules()
+        self.update_master_mute_button(any_active)
+        self.update_master_play_button(any_playing)
         if self.master_meter is not None:
-            master_level = self.compute_master_level(levels) * StemAudioPlayer.get_global_master_volume()
-            self.master_meter.configure(value=master_level)
+            global_volume = StemAudioPlayer.get_global_master_volume()
+            master_level = self.compute_master_level(level_sumsq) * global_volume
+            # Same quantization as the session meters
+            master_value = round(master_level * 200) / 200
+            if master_value != self.last_master_meter_value:
+                self.queue_write(self.master_meter.set_level, master_value)
+                self.last_master_meter_value = master_value
         self.update_master_volume_label()
-        self.window.after(200, self.update_loop)
 
     @staticmethod
     def format_session_name(name: str, max_len: int = 12) -> str:
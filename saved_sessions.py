@@ -1,12 +1,44 @@
+import errno
 import json
 import os
 import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
 
+COPY_WORKERS = 4
+
+
+def move_session_dir(src: str, dst: str):
+    """Move a session directory into the store.
+
+    On the same filesystem this is a single rename. Across filesystems the
+    files are copied in parallel (shutil.copy2 uses sendfile on Linux) and
+    the source is removed afterwards.
+    """
+    try:
+        os.rename(src, dst)
+        return
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+
+    pairs = []
+    for root, _dirs, names in os.walk(src):
+        target_root = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target_root, exist_ok=True)
+        pairs.extend(
+            (os.path.join(root, name), os.path.join(target_root, name))
+            for name in names
+        )
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        list(pool.map(lambda pair: shutil.copy2(*pair), pairs))
+    shutil.rmtree(src, ignore_errors=True)
+
+
 @dataclass
 class SavedSession:
     session_id: str
@@ -81,6 +113,9 @@ class SavedSessionStore:
 
         os.makedirs(self.sessions_dir, exist_ok=True)
         self.sessions: List[SavedSession] = []
+        # Bumped whenever the session list changes, so views can cache
+        # anything derived from it.
+        self.version = 0
         self._load_sessions()
 
     def _load_sessions(self):
@@ -134,7 +169,7 @@ class SavedSessionStore:
         audio_rel = os.path.relpath(audio_path, session_dir)
         stems_rel = os.path.relpath(stems_dir, session_dir) if stems_dir else None
 
-        shutil.move(session_dir, dest_dir)
+        move_session_dir(session_dir, dest_dir)
 
         thumb_rel = None
         if thumbnail_bytes:
@@ -155,6 +190,7 @@ class SavedSessionStore:
             created_at=datetime.now().isoformat(),
         )
         self.sessions.append(session)
+        self.version += 1
         self._write_sessions()
         return session
 
@@ -167,6 +203,7 @@ class SavedSessionStore:
             shutil.rmtree(session.session_dir, ignore_errors=True)
 
         self.sessions = [s for s in self.sessions if s.session_id != session_id]
+        self.version += 1
         self._write_sessions()
         return True
 
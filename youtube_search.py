@@ -1,9 +1,23 @@
+import hashlib
 import json
+import os
 import subprocess
-import urllib.request
+import threading
+import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+# Shared keep-alive session for thumbnail fetches: after the first request
+# to a host (i.ytimg.com), later ones reuse the open TLS connection.
+# Created on first use so importing this module does not pull in requests.
+_http = None
+_http_lock = threading.Lock()
+
+# Downloaded session thumbnails, one file per URL, kept across runs.
+# Oldest files (by last use) are pruned beyond THUMBNAIL_CACHE_MAX_FILES.
+THUMBNAIL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".djyt", "thumbnail_cache")
+THUMBNAIL_CACHE_MAX_FILES = 256
+
 
 @dataclass
 class SearchResult:
@@ -135,10 +149,85 @@ def format_time_ago(data: dict) -> str:
     return f"{years}y ago"
 
 
+def _get_http():
+    global _http
+    with _http_lock:
+        if _http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.headers["User-Agent"] = "Mozilla/5.0"
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+            _http = session
+        return _http
+
+
+def download_bytes(url: str, timeout: float = 10) -> bytes:
+    """GET ``url`` over the shared session; raises on network/HTTP errors."""
+    resp = _get_http().get(url, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content
+
+
+def _thumbnail_cache_path(url: str) -> str:
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(THUMBNAIL_CACHE_DIR, digest + ".bin")
+
+
+def _prune_thumbnail_cache():
+    try:
+        entries = [e for e in os.scandir(THUMBNAIL_CACHE_DIR) if e.name.endswith(".bin")]
+    except OSError:
+        return
+    excess = len(entries) - THUMBNAIL_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[:excess]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def download_bytes_cached(url: str, timeout: float = 10) -> bytes:
+    """
+    Like download_bytes, but served from the on-disk thumbnail cache when
+    this URL was fetched before. Cache problems never fail the download.
+    """
+    path = _thumbnail_cache_path(url)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if data:
+            os.utime(path)  # mark as recently used for pruning
+            return data
+    except OSError:
+        pass
+
+    data = download_bytes(url, timeout=timeout)
+    # A temp file per call: other threads or windows may be caching the
+    # same URL at the same time.
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        _prune_thumbnail_cache()
+    except OSError:
+        pass
+    finally:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass  # already moved into place
+    return data
+
+
 def fetch_thumbnail_bytes(url: str) -> bytes | None:
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return resp.read()
+        return download_bytes(url)
     except Exception:
         return None